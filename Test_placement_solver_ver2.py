@@ -6,6 +6,10 @@ This module provides functions to:
 2.  Calculate a score for a valid placement based on soft constraints.
 3.  Generate a plot to visualize a placement and its constraints.
 
+Solvers that evaluate many candidate placements should call validate_fast
+in their inner loop (boolean only, no report) and keep validate_placement
+for the final human-readable report.
+
 A candidate should import these functions into their own solver script to check
 the correctness and quality of their generated solution.
 
@@ -17,8 +21,20 @@ Expected Placement Dictionary Format:
 """
 import time
 import math
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from bisect import bisect_right
+from collections import namedtuple
+from itertools import combinations
+
+import numpy as np
+
+# matplotlib is imported lazily inside plot_placement: a scoring harness that
+# only validates pays neither the ~hundreds of ms of import time nor the RSS.
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
 
 # --- Assignment Constants (Part of the problem definition) ---
 BOARD_DIMS = (50, 50)
@@ -27,18 +43,470 @@ CENTER_OF_MASS_RADIUS = 2.0
 KEEPOUT_ZONE_DIMS = (10, 20)  # 10 wide, 15 inward
 VALIDATION_TIME_LIMIT = 2 # Validation should be extremely fast
 
+# Squared radii, precomputed at import so threshold checks can compare
+# squared distances and skip the sqrt entirely.
+_PROX_R2 = PROXIMITY_RADIUS * PROXIMITY_RADIUS
+_COM_R2 = CENTER_OF_MASS_RADIUS * CENTER_OF_MASS_RADIUS
+
+# Keep-out zone arithmetic that only depends on the constants above,
+# folded once at import instead of on every zone construction.
+_ZONE_W, _ZONE_H = KEEPOUT_ZONE_DIMS
+_ZONE_HALF = _ZONE_W * 0.5
+_BOARD_MINUS_ZH = BOARD_DIMS[1] - _ZONE_H
+_BOARD_MINUS_ZW = BOARD_DIMS[0] - _ZONE_H
+
+# Internal component record: a fixed-layout tuple whose fields are read with
+# C-level offset access instead of four string-hash dict lookups per use.
+# normalize() converts the documented dict-of-dicts input into these.
+Component = namedtuple('Component', ('x', 'y', 'w', 'h'))
+
+def normalize(placement):
+    """
+    Convert a user-supplied dict-of-dicts placement into a dict of Component
+    records. Values that are already Components pass through unchanged, so
+    normalizing an already-normalized placement is free.
+    """
+    return {name: comp if isinstance(comp, Component)
+            else Component(comp['x'], comp['y'], comp['w'], comp['h'])
+            for name, comp in placement.items()}
+
 # --- Geometric Helper Functions (Internal use) ---
 def _get_center(comp):
     """Calculates the center coordinates of a component."""
-    return (comp['x'] + comp['w'] / 2, comp['y'] + comp['h'] / 2)
+    return (comp.x + comp.w / 2, comp.y + comp.h / 2)
+
+# math.hypot as a module local: attribute-free lookups from the hot helpers.
+_hypot = math.hypot
 
 def _distance(p1, p2):
     """Calculates the Euclidean distance between two points."""
-    return math.sqrt((p2[0] - p1[0])**2 + (p2[1] - p1[1])**2)
+    return _hypot(p2[0] - p1[0], p2[1] - p1[1])
+
+def _sqdist(p1, p2):
+    """Squared Euclidean distance — enough for threshold checks, no sqrt."""
+    dx = p1[0] - p2[0]
+    dy = p1[1] - p2[1]
+    return dx * dx + dy * dy
+
+def _zone_for(usb):
+    """Keep-out rectangle (x, y, w, h) for a USB connector on any board edge."""
+    cx, cy = _get_center(usb)
+    if usb.y == 0:
+        return (cx - _ZONE_HALF, 0.0, _ZONE_W, _ZONE_H)
+    if usb.y + usb.h == BOARD_DIMS[1]:
+        return (cx - _ZONE_HALF, _BOARD_MINUS_ZH, _ZONE_W, _ZONE_H)
+    if usb.x == 0:
+        return (0.0, cy - _ZONE_HALF, _ZONE_H, _ZONE_W)
+    return (_BOARD_MINUS_ZW, cy - _ZONE_HALF, _ZONE_H, _ZONE_W)
+
+def _check_core(arr, usb_i, xt_i, mc_i, mb1_i, mb2_i,
+                board_w, board_h, prox_r2, com_r2, zone_w, zone_h):
+    """
+    Numeric core of the hard-constraint checks on a (N, 4) float64 array of
+    [x, y, w, h] rows. Returns a bitmask with one bit per rule (set = passed):
+
+        bit 0: boundary, bit 1: no overlap, bit 2: edge placement,
+        bit 3: parallel, bit 4: proximity, bit 5: global balance,
+        bit 6: keep-out path clear.
+
+    Pure scalar arithmetic — no dicts, tuples or Python objects — so Numba
+    can lower the whole thing to native code when it is available.
+    """
+    n = arr.shape[0]
+    mask = 0
+
+    # boundary
+    ok = True
+    for i in range(n):
+        if (arr[i, 0] < 0.0 or arr[i, 1] < 0.0 or
+                arr[i, 0] + arr[i, 2] > board_w or
+                arr[i, 1] + arr[i, 3] > board_h):
+            ok = False
+            break
+    if ok:
+        mask |= 1
+
+    # no overlapping
+    ok = True
+    for i in range(n):
+        for j in range(i + 1, n):
+            if not (arr[i, 0] + arr[i, 2] <= arr[j, 0] or
+                    arr[i, 0] >= arr[j, 0] + arr[j, 2] or
+                    arr[i, 1] + arr[i, 3] <= arr[j, 1] or
+                    arr[i, 1] >= arr[j, 1] + arr[j, 3]):
+                ok = False
+                break
+        if not ok:
+            break
+    if ok:
+        mask |= 2
+
+    # edge placement for USB + both mikroBUS connectors
+    ok = True
+    for k in range(3):
+        i = usb_i if k == 0 else (mb1_i if k == 1 else mb2_i)
+        if not (arr[i, 0] == 0.0 or arr[i, 1] == 0.0 or
+                arr[i, 0] + arr[i, 2] == board_w or
+                arr[i, 1] + arr[i, 3] == board_h):
+            ok = False
+            break
+    if ok:
+        mask |= 4
+
+    # parallel placement on opposite edges, same orientation
+    if arr[mb1_i, 2] == arr[mb2_i, 2]:
+        on_opp_v = ((arr[mb1_i, 0] == 0.0 and arr[mb2_i, 0] + arr[mb2_i, 2] == board_w) or
+                    (arr[mb1_i, 0] + arr[mb1_i, 2] == board_w and arr[mb2_i, 0] == 0.0))
+        on_opp_h = ((arr[mb1_i, 1] == 0.0 and arr[mb2_i, 1] + arr[mb2_i, 3] == board_h) or
+                    (arr[mb1_i, 1] + arr[mb1_i, 3] == board_h and arr[mb2_i, 1] == 0.0))
+        if on_opp_v or on_opp_h:
+            mask |= 8
+
+    # proximity (squared)
+    p1x = arr[xt_i, 0] + arr[xt_i, 2] * 0.5
+    p1y = arr[xt_i, 1] + arr[xt_i, 3] * 0.5
+    p2x = arr[mc_i, 0] + arr[mc_i, 2] * 0.5
+    p2y = arr[mc_i, 1] + arr[mc_i, 3] * 0.5
+    dx = p1x - p2x
+    dy = p1y - p2y
+    if dx * dx + dy * dy <= prox_r2:
+        mask |= 16
+
+    # global balance (squared)
+    sx = 0.0
+    sy = 0.0
+    for i in range(n):
+        sx += arr[i, 0] + arr[i, 2] * 0.5
+        sy += arr[i, 1] + arr[i, 3] * 0.5
+    cx = sx / n - board_w * 0.5
+    cy = sy / n - board_h * 0.5
+    if cx * cx + cy * cy <= com_r2:
+        mask |= 32
+
+    # keep-out zone: crystal->microcontroller segment vs USB zone rectangle
+    ucx = arr[usb_i, 0] + arr[usb_i, 2] * 0.5
+    ucy = arr[usb_i, 1] + arr[usb_i, 3] * 0.5
+    if arr[usb_i, 1] == 0.0:
+        zx, zy, zw, zh = ucx - zone_w * 0.5, 0.0, zone_w, zone_h
+    elif arr[usb_i, 1] + arr[usb_i, 3] == board_h:
+        zx, zy, zw, zh = ucx - zone_w * 0.5, board_h - zone_h, zone_w, zone_h
+    elif arr[usb_i, 0] == 0.0:
+        zx, zy, zw, zh = 0.0, ucy - zone_w * 0.5, zone_h, zone_w
+    else:
+        zx, zy, zw, zh = board_w - zone_h, ucy - zone_w * 0.5, zone_h, zone_w
+
+    if not _seg_hits_rect(p1x, p1y, p2x, p2y, zx, zy, zx + zw, zy + zh):
+        mask |= 64
+
+    return mask
+
+def _outcode(x, y, zx, zy, zx2, zy2):
+    """Cohen-Sutherland 4-bit position code of a point against a rectangle."""
+    code = 0
+    if x < zx:
+        code |= 1
+    elif x > zx2:
+        code |= 2
+    if y < zy:
+        code |= 4
+    elif y > zy2:
+        code |= 8
+    return code
+
+def _seg_hits_rect(p1x, p1y, p2x, p2y, zx, zy, zx2, zy2):
+    """
+    Does segment p1-p2 cross any edge of the axis-aligned rectangle
+    (zx, zy)-(zx2, zy2)?
+
+    Sign-of-line-equation formulation: the segment's line coefficients
+    (A1, B1, C1) are computed once, evaluated at the four rectangle corners,
+    and each edge test combines two of those shared values with a
+    sign-product <= 0 check. The opposite test — segment endpoints against
+    the edge's line — collapses to a coordinate comparison because every
+    edge of an axis-aligned box is horizontal or vertical. Roughly 40% fewer
+    multiplications than the four CCW pair tests, and, unlike the strict
+    CCW comparisons, collinear and endpoint-touching contact counts as a hit.
+
+    A Cohen-Sutherland outcode pre-check handles the two common cases first:
+    both endpoints beyond the same side of the zone is a trivial miss (8
+    comparisons, no multiplies), and an endpoint inside (or on) the zone is
+    a trivial hit — the path enters the zone even without crossing an edge.
+    """
+    oa = _outcode(p1x, p1y, zx, zy, zx2, zy2)
+    ob = _outcode(p2x, p2y, zx, zy, zx2, zy2)
+    if oa & ob:
+        return False
+    if oa == 0 or ob == 0:
+        return True
+    a1 = p2y - p1y
+    b1 = p1x - p2x
+    c1 = p2x * p1y - p1x * p2y
+    f_tl = a1 * zx + b1 * zy + c1
+    f_tr = a1 * zx2 + b1 * zy + c1
+    f_br = a1 * zx2 + b1 * zy2 + c1
+    f_bl = a1 * zx + b1 * zy2 + c1
+    if f_tl * f_tr <= 0.0 and (p1y - zy) * (p2y - zy) <= 0.0:      # top edge
+        return True
+    if f_tr * f_br <= 0.0 and (p1x - zx2) * (p2x - zx2) <= 0.0:    # right edge
+        return True
+    if f_br * f_bl <= 0.0 and (p1y - zy2) * (p2y - zy2) <= 0.0:    # bottom edge
+        return True
+    if f_bl * f_tl <= 0.0 and (p1x - zx) * (p2x - zx) <= 0.0:      # left edge
+        return True
+    return False
+
+if _HAVE_NUMBA:
+    # cache=True writes the compiled kernel to disk, so the ~seconds of JIT
+    # compilation are paid once per machine, not once per process.
+    _outcode = njit(cache=True, fastmath=True)(_outcode)
+    _seg_hits_rect = njit(cache=True, fastmath=True)(_seg_hits_rect)
+    _check_core = njit(cache=True, fastmath=True)(_check_core)
+
+# Fixed component order for the scratch buffer: known names map to fixed
+# row indices, so repeat validations write into the same (5, 4) array
+# instead of allocating a fresh one per call. The checker is used from
+# single-threaded solver scripts, so one module-level buffer suffices.
+_COMP_ORDER = ('USB_CONNECTOR', 'MICROCONTROLLER', 'CRYSTAL',
+               'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2')
+_SOA_BUF = np.empty((len(_COMP_ORDER), 4), dtype=np.float64)
+
+def _fill_soa(placement, buf=_SOA_BUF):
+    """Write the placement into a preallocated (5, 4) [x, y, w, h] buffer."""
+    for i, name in enumerate(_COMP_ORDER):
+        c = placement[name]
+        buf[i, 0] = c.x
+        buf[i, 1] = c.y
+        buf[i, 2] = c.w
+        buf[i, 3] = c.h
+    return buf
+
+def _as_array(placement):
+    """
+    Materialize a placement dict as (names, (N, 4) float64 [x, y, w, h] rows).
+
+    A placement with exactly the five known components reuses the module
+    scratch buffer in _COMP_ORDER; anything else falls back to building a
+    fresh array in dict order.
+    """
+    if len(placement) == len(_COMP_ORDER) and all(n in placement for n in _COMP_ORDER):
+        return list(_COMP_ORDER), _fill_soa(placement)
+    names = list(placement.keys())
+    # Component fields iterate in (x, y, w, h) order
+    comp_arr = np.fromiter((f for v in placement.values() for f in v),
+                           dtype=np.float64).reshape(-1, 4)
+    return names, comp_arr
+
+# --- Per-rule helpers for the short-circuiting fast path ---
+
+def _boundary_ok(placement):
+    for c in placement.values():
+        if (c.x < 0 or c.y < 0 or
+                c.x + c.w > BOARD_DIMS[0] or c.y + c.h > BOARD_DIMS[1]):
+            return False
+    return True
+
+def _edges_ok(placement):
+    for name in ('USB_CONNECTOR', 'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2'):
+        c = placement[name]
+        if not (c.x == 0 or c.y == 0 or
+                c.x + c.w == BOARD_DIMS[0] or c.y + c.h == BOARD_DIMS[1]):
+            return False
+    return True
+
+def _parallel_ok(placement):
+    mb1, mb2 = placement['MIKROBUS_CONNECTOR_1'], placement['MIKROBUS_CONNECTOR_2']
+    if mb1.w != mb2.w:
+        return False
+    on_opp_v = (mb1.x == 0 and mb2.x + mb2.w == BOARD_DIMS[0]) or \
+               (mb1.x + mb1.w == BOARD_DIMS[0] and mb2.x == 0)
+    on_opp_h = (mb1.y == 0 and mb2.y + mb2.h == BOARD_DIMS[1]) or \
+               (mb1.y + mb1.h == BOARD_DIMS[1] and mb2.y == 0)
+    return on_opp_v or on_opp_h
+
+def _prox_ok(placement):
+    return _sqdist(_get_center(placement['CRYSTAL']),
+                   _get_center(placement['MICROCONTROLLER'])) <= _PROX_R2
+
+def _overlaps(a, b):
+    return not (a.x + a.w <= b.x or a.x >= b.x + b.w or
+                a.y + a.h <= b.y or a.y >= b.y + b.h)
+
+# Above this size the O(N^2) pairwise loop loses to the sweep line.
+_SWEEP_THRESHOLD = 16
+
+def _overlap_any_sweep(comps):
+    """
+    Sweep-line overlap detection, O((N + K) log N) instead of O(N^2).
+
+    Components are visited left to right; an active list of rectangles still
+    under the sweep line is kept sorted by y, so only candidates whose
+    y-range can reach the new rectangle (found via bisect) go through the
+    full AABB test. Rectangles whose right edge has passed the line are
+    evicted as it advances.
+    """
+    order = sorted(comps, key=lambda c: c.x)
+    active = []   # rectangles still alive at the sweep line, sorted by y
+    ys = []       # their y coordinates, parallel to `active`, for bisect
+    for c in order:
+        if active:
+            keep = [a for a in active if a.x + a.w > c.x]
+            if len(keep) != len(active):
+                active = keep
+                ys = [a.y for a in active]
+        # every survivor overlaps c in x, so only the y test remains;
+        # candidates above c.y + c.h cannot overlap and are skipped entirely
+        hi = bisect_right(ys, c.y + c.h)
+        for a in active[:hi]:
+            if a.y + a.h > c.y and a.y < c.y + c.h:
+                return True
+        i = bisect_right(ys, c.y)
+        active.insert(i, c)
+        ys.insert(i, c.y)
+    return False
+
+def _overlap_any(placement):
+    if len(placement) > _SWEEP_THRESHOLD:
+        return _overlap_any_sweep(list(placement.values()))
+    # any() over combinations short-circuits in C, with no sentinel flag
+    # or nested break dance
+    return any(_overlaps(a, b) for a, b in combinations(placement.values(), 2))
+
+def validate_placement_many(components):
+    """
+    Overlap-only check that scales to boards with many components.
+
+    Args:
+        components: A placement dict or any iterable of component records
+            (dicts with 'x'/'y'/'w'/'h' or Component tuples).
+
+    Returns:
+        bool: True if no two components overlap.
+    """
+    if isinstance(components, dict):
+        components = components.values()
+    comps = [c if isinstance(c, Component) else Component(c['x'], c['y'], c['w'], c['h'])
+             for c in components]
+    return not _overlap_any_sweep(comps)
+
+def _com_ok(placement):
+    sx = sy = 0.0
+    for c in placement.values():
+        sx += c.x + c.w * 0.5
+        sy += c.y + c.h * 0.5
+    inv_n = 1.0 / len(placement)
+    return _sqdist((sx * inv_n, sy * inv_n),
+                   (BOARD_DIMS[0] / 2, BOARD_DIMS[1] / 2)) <= _COM_R2
+
+def _keepout_clear(placement):
+    zx, zy, zw, zh = _zone_for(placement['USB_CONNECTOR'])
+    p1 = _get_center(placement['CRYSTAL'])
+    p2 = _get_center(placement['MICROCONTROLLER'])
+    return not _seg_hits_rect(p1[0], p1[1], p2[0], p2[1], zx, zy, zx + zw, zy + zh)
+
+class _Placement:
+    """
+    One-time parsed view of a placement, shared across validate/score/plot.
+
+    A solver typically calls validate -> score -> (optionally) plot on the
+    same dict back to back; each of those used to re-parse the input
+    independently. Wrapping the dict in a _Placement does the work once:
+    Component records, the SoA array, the derived x2/y2 columns and the
+    per-component centers. All three public functions accept either a plain
+    dict or a _Placement.
+    """
+    __slots__ = ('d', 'names', 'soa', 'centers', 'x2', 'y2')
+
+    def __init__(self, d):
+        self.d = normalize(d)
+        names, soa = _as_array(self.d)
+        self.names = names
+        # own copy: the shared scratch buffer may be overwritten by a later
+        # validation while this view is still alive
+        self.soa = soa.copy() if soa is _SOA_BUF else soa
+        self.centers = self.soa[:, :2] + self.soa[:, 2:] / 2
+        self.x2 = self.soa[:, 0] + self.soa[:, 2]
+        self.y2 = self.soa[:, 1] + self.soa[:, 3]
+
+def _build_validated():
+    """
+    Generate a fully-unrolled boundary + pairwise-overlap checker for the
+    fixed five-component placement, specialised at import time.
+
+    The component count and board size are constants, so the 5 boundary
+    checks and all 10 pairwise separation tests are written out as one flat
+    boolean expression over 20 scalar arguments — no loops, no indexing, and
+    the board dimensions are baked in as literals.
+    """
+    n = len(_COMP_ORDER)
+    bw, bh = BOARD_DIMS
+    args = ', '.join(f'x{i}, y{i}, w{i}, h{i}' for i in range(n))
+    parts = [f'x{i} >= 0 and y{i} >= 0 and x{i} + w{i} <= {bw} and y{i} + h{i} <= {bh}'
+             for i in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            parts.append(f'(x{i} + w{i} <= x{j} or x{i} >= x{j} + w{j} or '
+                         f'y{i} + h{i} <= y{j} or y{i} >= y{j} + h{j})')
+    body = ' and\n            '.join(parts)
+    src = f'def _validated({args}):\n    return ({body})\n'
+    namespace = {}
+    exec(compile(src, '<generated _validated>', 'exec'), namespace)
+    return namespace['_validated']
+
+# Unrolled bounds-and-overlap test for the standard five components.
+_validated = _build_validated()
 
 # --- Public Utility Functions for Candidates ---
 
-def validate_placement(placement):
+def validate_fast(placement):
+    """
+    Boolean-only validation for solver inner loops.
+
+    Runs the same seven hard-constraint checks as validate_placement but
+    prints nothing and builds no report strings. With Numba the whole check
+    is a single native-code pass; otherwise the rules short-circuit at the
+    first failure, ordered cheapest first: boundary, edge, parallel,
+    proximity, overlap, centre of mass, keep-out.
+
+    Args:
+        placement: A component placement dictionary (same format as
+            validate_placement), or a _Placement view of one.
+
+    Returns:
+        bool: True if the placement satisfies all hard constraints.
+    """
+    view = placement if isinstance(placement, _Placement) else None
+    if view is not None:
+        placement = view.d
+    required_keys = ('USB_CONNECTOR', 'MICROCONTROLLER', 'CRYSTAL',
+                     'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2')
+    if not all(key in placement for key in required_keys):
+        return False
+    if view is None:
+        placement = normalize(placement)
+    if _HAVE_NUMBA:
+        names, comp_arr = (view.names, view.soa) if view is not None \
+            else _as_array(placement)
+        mask = _check_core(comp_arr,
+                           names.index('USB_CONNECTOR'), names.index('CRYSTAL'),
+                           names.index('MICROCONTROLLER'),
+                           names.index('MIKROBUS_CONNECTOR_1'),
+                           names.index('MIKROBUS_CONNECTOR_2'),
+                           float(BOARD_DIMS[0]), float(BOARD_DIMS[1]),
+                           _PROX_R2, _COM_R2,
+                           float(KEEPOUT_ZONE_DIMS[0]), float(KEEPOUT_ZONE_DIMS[1]))
+        return mask == 0x7F
+    if len(placement) == len(_COMP_ORDER):
+        # standard five-component shape: one flat generated expression covers
+        # boundary and all pairwise overlaps
+        bounds_and_overlap = _validated(
+            *(f for name in _COMP_ORDER for f in placement[name]))
+    else:
+        bounds_and_overlap = _boundary_ok(placement) and not _overlap_any(placement)
+    return (bounds_and_overlap and _edges_ok(placement) and
+            _parallel_ok(placement) and _prox_ok(placement) and
+            _com_ok(placement) and _keepout_clear(placement))
+
+def validate_placement(placement, _centers_out=None, verbose=True):
     """
     Validates a component placement against all hard constraints.
 
@@ -49,102 +517,147 @@ def validate_placement(placement):
         placement (dict): A dictionary representing the component placement.
             Keys should be the component names (e.g., 'USB_CONNECTOR').
             Values should be dictionaries with 'x', 'y', 'w', 'h' keys.
+            A _Placement view is also accepted and skips re-parsing.
+        _centers_out (dict, optional): If given, filled with the component
+            centers computed during validation (name -> (cx, cy)), so a
+            follow-up score_placement/plot_placement call can reuse them.
+        verbose (bool): If False, skip the printed report (and its string
+            formatting) entirely and just return the verdict.
 
     Returns:
         bool: True if the placement satisfies all hard constraints, False otherwise.
     """
-    print("--- Running Detailed Hard Constraint Validation ---")
+    if verbose:
+        print("--- Running Detailed Hard Constraint Validation ---")
     results = {}
-    
+
+    # Hoist the module constants into locals: LOAD_FAST instead of
+    # LOAD_GLOBAL + BINARY_SUBSCR on every reference below.
+    BW, BH = BOARD_DIMS
+    KZW, KZH = KEEPOUT_ZONE_DIMS
+    PROX = PROXIMITY_RADIUS
+    COM_R = CENTER_OF_MASS_RADIUS
+
+    view = placement if isinstance(placement, _Placement) else None
+    if view is not None:
+        placement = view.d
+
     # Check for presence of all required components
-    required_keys = ['USB_CONNECTOR', 'MICROCONTROLLER', 'CRYSTAL', 
+    required_keys = ['USB_CONNECTOR', 'MICROCONTROLLER', 'CRYSTAL',
                      'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2']
     if not all(key in placement for key in required_keys):
-        print("❌ FAILED: The placement dictionary is missing one or more required components.")
+        if verbose:
+            print("❌ FAILED: The placement dictionary is missing one or more required components.")
         return False
 
-    # Rule 5: Boundary Constraint
-    all_in_bounds = True
-    for name, comp in placement.items():
-        if not (comp['x'] >= 0 and comp['y'] >= 0 and
-                comp['x'] + comp['w'] <= BOARD_DIMS[0] and
-                comp['y'] + comp['h'] <= BOARD_DIMS[1]):
-            all_in_bounds = False
-            break
-    results["Boundary Constraint"] = (all_in_bounds, "")
-
-    # Rule 4: No Overlapping
-    items = list(placement.items())
-    overlap_found = False
-    for i in range(len(items)):
-        for j in range(i + 1, len(items)):
-            c1, c2 = items[i][1], items[j][1]
-            if not (c1['x'] + c1['w'] <= c2['x'] or c1['x'] >= c2['x'] + c2['w'] or
-                    c1['y'] + c1['h'] <= c2['y'] or c1['y'] >= c2['y'] + c2['h']):
-                overlap_found = True
-                break
-        if overlap_found: break
-    results["No Overlapping"] = (not overlap_found, "")
-    
-    # Rule 1: Edge Placement
-    edge_names = ['USB_CONNECTOR', 'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2']
-    all_on_edge = True
-    for name in edge_names:
-        comp = placement[name]
-        if not (comp['x'] == 0 or comp['y'] == 0 or
-                comp['x'] + comp['w'] == BOARD_DIMS[0] or comp['y'] + comp['h'] == BOARD_DIMS[1]):
-            all_on_edge = False
-            break
-    results["Edge Placement"] = (all_on_edge, "")
+    # Materialize the placement once as a structure-of-arrays (N, 4) float
+    # array (or reuse the caller's _Placement view, which already did it).
+    # Every geometric rule below then runs as a handful of C-level NumPy ops
+    # instead of Python loops over dict-of-dict records.
+    if view is None:
+        view = _Placement(placement)
+        placement = view.d
+    names, comp_arr = view.names, view.soa
+    x1, y1 = comp_arr[:, 0], comp_arr[:, 1]
+    x2, y2 = view.x2, view.y2
+    centers = view.centers
+
+    usb_i = names.index('USB_CONNECTOR')
+    mc_i = names.index('MICROCONTROLLER')
+    xt_i = names.index('CRYSTAL')
+    mb1_i = names.index('MIKROBUS_CONNECTOR_1')
+    mb2_i = names.index('MIKROBUS_CONNECTOR_2')
+
+    if _centers_out is not None:
+        for i, name in enumerate(names):
+            _centers_out[name] = (centers[i, 0], centers[i, 1])
+
+    # The report needs the two actual distances regardless of which backend
+    # ran the checks, so compute them once here (cheap, scalar).
+    prox_sq = _sqdist(centers[xt_i], centers[mc_i])
+    board_center = (BW / 2, BH / 2)
+    # column sums + one reciprocal multiply: no mean() temporary, no
+    # per-component generator frames or center tuples
+    inv_n = 1.0 / len(names)
+    com_x = centers[:, 0].sum() * inv_n
+    com_y = centers[:, 1].sum() * inv_n
+    com_sq = _sqdist((com_x, com_y), board_center)
+
+    if _HAVE_NUMBA:
+        # Single native-code pass over the array; one bit per rule.
+        mask = _check_core(comp_arr, usb_i, xt_i, mc_i, mb1_i, mb2_i,
+                           float(BW), float(BH),
+                           _PROX_R2, _COM_R2,
+                           float(KZW), float(KZH))
+        all_in_bounds = bool(mask & 1)
+        overlap_found = not (mask & 2)
+        all_on_edge = bool(mask & 4)
+        is_parallel = bool(mask & 8)
+        intersects = not (mask & 64)
+    else:
+        # Vectorized NumPy fallback.
+        # Rule 5: Boundary Constraint
+        all_in_bounds = bool((comp_arr[:, :2] >= 0).all() and
+                             (x2 <= BW).all() and (y2 <= BH).all())
+
+        # Rule 4: No Overlapping — branchless broadcasted AABB separation test.
+        # Two boxes are separated iff one lies fully left/right/above/below the
+        # other; any non-separated pair in the strict upper triangle overlaps.
+        sep = (x2[:, None] <= x1[None, :]) | (x1[:, None] >= x2[None, :]) | \
+              (y2[:, None] <= y1[None, :]) | (y1[:, None] >= y2[None, :])
+        overlap_found = bool(np.triu(~sep, 1).any())
+
+        # Rule 1: Edge Placement
+        edge_idx = [usb_i, mb1_i, mb2_i]
+        all_on_edge = bool(((x1[edge_idx] == 0) | (y1[edge_idx] == 0) |
+                            (x2[edge_idx] == BW) |
+                            (y2[edge_idx] == BH)).all())
+
+        # Rule 2: Parallel Placement
+        mb1, mb2 = placement['MIKROBUS_CONNECTOR_1'], placement['MIKROBUS_CONNECTOR_2']
+        is_parallel = False
+        if mb1.w == mb2.w:  # Same orientation
+            on_opp_v = (mb1.x == 0 and mb2.x + mb2.w == BW) or \
+                       (mb1.x + mb1.w == BW and mb2.x == 0)
+            on_opp_h = (mb1.y == 0 and mb2.y + mb2.h == BH) or \
+                       (mb1.y + mb1.h == BH and mb2.y == 0)
+            if on_opp_v or on_opp_h:
+                is_parallel = True
+
+        # Rule 7: Crystal Keep-Out Zone
+        zx, zy, zw, zh = _zone_for(placement['USB_CONNECTOR'])
+        p1, p2 = centers[xt_i], centers[mc_i]
+        intersects = _seg_hits_rect(p1[0], p1[1], p2[0], p2[1],
+                                    zx, zy, zx + zw, zy + zh)
+
+    # Store raw payloads only; message strings are formatted lazily in the
+    # report loop so the non-verbose path never pays for float formatting.
+    results["Boundary Constraint"] = (all_in_bounds, None)
+    results["No Overlapping"] = (not overlap_found, None)
+    results["Edge Placement"] = (all_on_edge, None)
+    results["Parallel Placement"] = (is_parallel, None)
+    results["Proximity Constraint"] = (prox_sq <= _PROX_R2, prox_sq)
+    results["Global Balance"] = (com_sq <= _COM_R2, com_sq)
+    results["Keep-Out Zone"] = (not intersects, None)
+
+    all_valid = all(is_valid for is_valid, _ in results.values())
+
+    if verbose:
+        for rule, (is_valid, payload) in results.items():
+            status = "✅ PASSED" if is_valid else "❌ FAILED"
+            if rule == "Proximity Constraint":
+                msg = f"Actual distance: {math.sqrt(payload):.2f} (Limit: {PROX})"
+            elif rule == "Global Balance":
+                msg = f"CoM dist from center: {math.sqrt(payload):.2f} (Limit: {COM_R})"
+            elif rule == "Keep-Out Zone":
+                msg = "Path is clear" if is_valid else "Path is obstructed"
+            else:
+                msg = ""
+            print(f"{rule:<22}: {status} {msg}")
 
-    # Rule 2: Parallel Placement
-    mb1, mb2 = placement['MIKROBUS_CONNECTOR_1'], placement['MIKROBUS_CONNECTOR_2']
-    is_parallel = False
-    if mb1['w'] == mb2['w']:  # Same orientation
-        on_opp_v = (mb1['x'] == 0 and mb2['x'] + mb2['w'] == BOARD_DIMS[0]) or \
-                   (mb1['x'] + mb1['w'] == BOARD_DIMS[0] and mb2['x'] == 0)
-        on_opp_h = (mb1['y'] == 0 and mb2['y'] + mb2['h'] == BOARD_DIMS[1]) or \
-                   (mb1['y'] + mb1['h'] == BOARD_DIMS[1] and mb2['y'] == 0)
-        if on_opp_v or on_opp_h:
-            is_parallel = True
-    results["Parallel Placement"] = (is_parallel, "")
-
-    # Rule 3: Proximity Constraint
-    dist = _distance(_get_center(placement['CRYSTAL']), _get_center(placement['MICROCONTROLLER']))
-    results["Proximity Constraint"] = (dist <= PROXIMITY_RADIUS, f"Actual distance: {dist:.2f} (Limit: {PROXIMITY_RADIUS})")
-
-    # Rule 6: Global Balance Constraint
-    board_center = (BOARD_DIMS[0] / 2, BOARD_DIMS[1] / 2)
-    com_x = sum(_get_center(c)[0] for c in placement.values()) / len(placement)
-    com_y = sum(_get_center(c)[1] for c in placement.values()) / len(placement)
-    com_dist = _distance((com_x, com_y), board_center)
-    results["Global Balance"] = (com_dist <= CENTER_OF_MASS_RADIUS, f"CoM dist from center: {com_dist:.2f} (Limit: {CENTER_OF_MASS_RADIUS})")
-
-    # Rule 7: Crystal Keep-Out Zone
-    usb, crystal, micro = placement['USB_CONNECTOR'], placement['CRYSTAL'], placement['MICROCONTROLLER']
-    zone_w, zone_h_inward = KEEPOUT_ZONE_DIMS
-    usb_cx, usb_cy = _get_center(usb)
-    if usb['y'] == 0: zone = {'x': usb_cx - zone_w / 2, 'y': 0, 'w': zone_w, 'h': zone_h_inward}
-    elif usb['y'] + usb['h'] == BOARD_DIMS[1]: zone = {'x': usb_cx - zone_w / 2, 'y': BOARD_DIMS[1] - zone_h_inward, 'w': zone_w, 'h': zone_h_inward}
-    elif usb['x'] == 0: zone = {'x': 0, 'y': usb_cy - zone_w / 2, 'w': zone_h_inward, 'h': zone_w}
-    else: zone = {'x': BOARD_DIMS[0] - zone_h_inward, 'y': usb_cy - zone_w / 2, 'w': zone_h_inward, 'h': zone_w}
-    p1, p2 = _get_center(crystal), _get_center(micro)
-    def ccw(A,B,C): return (C[1]-A[1]) * (B[0]-A[0]) > (B[1]-A[1]) * (C[0]-A[0])
-    def intersect(A,B,C,D): return ccw(A,C,D) != ccw(B,C,D) and ccw(A,B,C) != ccw(A,B,D)
-    tl, tr, bl, br = (zone['x'], zone['y']), (zone['x'] + zone['w'], zone['y']), (zone['x'], zone['y'] + zone['h']), (zone['x'] + zone['w'], zone['y'] + zone['h'])
-    intersects = (intersect(p1, p2, tl, tr) or intersect(p1, p2, tr, br) or intersect(p1, p2, br, bl) or intersect(p1, p2, bl, tl))
-    results["Keep-Out Zone"] = (not intersects, "Path is clear" if not intersects else "Path is obstructed")
-
-    # Print Report
-    all_valid = True
-    for rule, (is_valid, msg) in results.items():
-        status = "✅ PASSED" if is_valid else "❌ FAILED"
-        print(f"{rule:<22}: {status} {msg}")
-        if not is_valid: all_valid = False
-    
     return all_valid
 
-def score_placement(placement):
+def score_placement(placement, centers=None, _soa_in=None):
     """
     Calculates a score for a placement based on soft constraints.
 
@@ -157,20 +670,36 @@ def score_placement(placement):
 
     Args:
         placement (dict): A valid component placement dictionary.
+        centers (dict, optional): Component centers as filled in by
+            validate_placement(..., _centers_out=...); avoids recomputing them.
+        _soa_in (ndarray, optional): An (N, 4) [x, y, w, h] array already
+            built for this placement (e.g. by _as_array); avoids rebuilding it.
 
     Returns:
         float: The calculated total score for the placement.
     """
     print("\n--- Calculating Placement Score (Lower is Better) ---")
-    min_x = min(c['x'] for c in placement.values())
-    max_x = max(c['x'] + c['w'] for c in placement.values())
-    min_y = min(c['y'] for c in placement.values())
-    max_y = max(c['y'] + c['h'] for c in placement.values())
-    bounding_box_area = (max_x - min_x) * (max_y - min_y)
-    
-    board_center = (BOARD_DIMS[0] / 2, BOARD_DIMS[1] / 2)
-    micro_center = _get_center(placement['MICROCONTROLLER'])
-    centrality_score = _distance(micro_center, board_center)
+    view = placement if isinstance(placement, _Placement) else None
+    if view is not None:
+        placement = view.d
+        A = view.soa
+    else:
+        placement = normalize(placement)
+        A = _soa_in if _soa_in is not None else _as_array(placement)[1]
+    # One pass over the SoA array instead of four generator sweeps of the dict.
+    x1, y1 = A[:, 0], A[:, 1]
+    x2 = x1 + A[:, 2]
+    y2 = y1 + A[:, 3]
+    bounding_box_area = float((x2.max() - x1.min()) * (y2.max() - y1.min()))
+
+    if centers is not None:
+        micro_center = centers['MICROCONTROLLER']
+    elif view is not None:
+        micro_center = view.centers[view.names.index('MICROCONTROLLER')]
+    else:
+        micro_center = _get_center(placement['MICROCONTROLLER'])
+    centrality_score = math.hypot(micro_center[0] - BOARD_DIMS[0] / 2,
+                                  micro_center[1] - BOARD_DIMS[1] / 2)
     
     total_score = bounding_box_area + (centrality_score * 10) # Weight centrality
     print(f"Compactness Score (Bounding Box Area): {bounding_box_area:.2f}")
@@ -180,58 +709,123 @@ def score_placement(placement):
     print(f"-------------------------------------------")
     return total_score
 
-def plot_placement(placement):
+# Lazily-built figure, axes and artists reused across plot_placement calls;
+# the static board/grid background is cached once for blitting.
+_PLOT_CACHE = None
+
+def plot_placement(placement, block=True):
     """
     Generates a matplotlib plot to visualize the component placement.
 
     This function displays the board, grid, components, and visual indicators
-    for the proximity and keep-out zone constraints. Execution will be
-    blocked until the plot window is closed.
+    for the proximity and keep-out zone constraints. The figure, axes and all
+    artists are created once and reused on subsequent calls — only the artist
+    geometry is updated and the canvas is redrawn via blitting, so a solver
+    can cheaply visualize many candidate placements in a row.
 
     Args:
         placement (dict): A component placement dictionary to visualize.
+        block (bool): If True (default), block until the plot window is
+            closed, as before. Pass False to just update the canvas and
+            return immediately.
     """
-    fig, ax = plt.subplots(figsize=(8, 8))
-    ax.set_xlim(0, BOARD_DIMS[0])
-    ax.set_ylim(0, BOARD_DIMS[1])
-    ax.set_xticks(range(0, BOARD_DIMS[0] + 1, 5))
-    ax.set_yticks(range(0, BOARD_DIMS[1] + 1, 5))
-    ax.grid(True, linestyle='--', color='gray', alpha=0.5)
-    ax.set_aspect('equal', adjustable='box')
-    ax.invert_yaxis()
-    ax.set_title("PCB Component Placement Solution")
-    
-    colors = {'USB_CONNECTOR': '#e74c3c', 'MICROCONTROLLER': '#3498db', 'CRYSTAL': '#f39c12',
+    global _PLOT_CACHE
+
+    # Lazy import: cached by Python after the first call, so repeated plots
+    # pay nothing and validate-only runs never pay at all.
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+
+    if isinstance(placement, _Placement):
+        placement = placement.d
+    else:
+        placement = normalize(placement)
+    BW, BH = BOARD_DIMS
+
+    colors ={'USB_CONNECTOR': '#e74c3c', 'MICROCONTROLLER': '#3498db', 'CRYSTAL': '#f39c12',
               'MIKROBUS_CONNECTOR_1': '#9b59b6', 'MIKROBUS_CONNECTOR_2': '#8e44ad'}
     labels = {'USB_CONNECTOR': 'USB', 'MICROCONTROLLER': 'μC', 'CRYSTAL': 'XTAL',
               'MIKROBUS_CONNECTOR_1': 'MB1', 'MIKROBUS_CONNECTOR_2': 'MB2'}
 
+    # A blocking show() lets the user destroy the window, so drop the cache
+    # if the cached figure no longer exists.
+    if _PLOT_CACHE is not None and not plt.fignum_exists(_PLOT_CACHE['fig'].number):
+        _PLOT_CACHE = None
+
+    if _PLOT_CACHE is None:
+        fig, ax = plt.subplots(figsize=(8, 8))
+        ax.set_xlim(0, BW)
+        ax.set_ylim(0, BH)
+        ax.set_xticks(range(0, BW + 1, 5))
+        ax.set_yticks(range(0, BH + 1, 5))
+        ax.grid(True, linestyle='--', color='gray', alpha=0.5)
+        ax.set_aspect('equal', adjustable='box')
+        ax.invert_yaxis()
+        ax.set_title("PCB Component Placement Solution")
+
+        rects, texts = {}, {}
+        for name in colors:
+            rect = patches.Rectangle((0, 0), 0, 0, linewidth=1,
+                                     edgecolor='black', facecolor=colors[name])
+            ax.add_patch(rect)
+            rects[name] = rect
+            texts[name] = ax.text(0, 0, labels[name], color='white',
+                                  ha='center', va='center', fontweight='bold')
+        circle = patches.Circle((0, 0), PROXIMITY_RADIUS, fill=True, color='#f39c12',
+                                alpha=0.1, linestyle='--', lw=2)
+        ax.add_patch(circle)
+        keepout = patches.Rectangle((0, 0), 0, 0, fill=True, color='#e74c3c',
+                                    alpha=0.15, linestyle='--', lw=2)
+        ax.add_patch(keepout)
+        line, = ax.plot([], [], 'k--')
+
+        # Draw once with the dynamic artists hidden to capture the static
+        # board/grid background for blitting.
+        dynamic = (circle, keepout, line) + tuple(rects.values()) + tuple(texts.values())
+        for artist in dynamic:
+            artist.set_visible(False)
+        fig.canvas.draw()
+        bg = fig.canvas.copy_from_bbox(ax.bbox)
+        for artist in dynamic:
+            artist.set_visible(True)
+
+        _PLOT_CACHE = {'fig': fig, 'ax': ax, 'rects': rects, 'texts': texts,
+                       'circle': circle, 'keepout': keepout, 'line': line, 'bg': bg}
+
+    cache = _PLOT_CACHE
+    fig, ax = cache['fig'], cache['ax']
+
+    # compute every center once up front instead of re-deriving per artist
+    centers = {name: _get_center(comp) for name, comp in placement.items()}
+
     for name, comp in placement.items():
-        rect = patches.Rectangle((comp['x'], comp['y']), comp['w'], comp['h'],
-                                 linewidth=1, edgecolor='black', facecolor=colors[name])
-        ax.add_patch(rect)
-        ax.text(comp['x'] + comp['w'] / 2, comp['y'] + comp['h'] / 2, labels[name],
-                color='white', ha='center', va='center', fontweight='bold')
-    
-    uc_center = _get_center(placement['MICROCONTROLLER'])
-    circle = patches.Circle(uc_center, PROXIMITY_RADIUS, fill=True, color='#f39c12', alpha=0.1,
-                            linestyle='--', lw=2)
-    ax.add_patch(circle)
-    
-    usb = placement['USB_CONNECTOR']
-    zone_w, zone_h_inward = KEEPOUT_ZONE_DIMS
-    usb_cx, usb_cy = _get_center(usb)
-    if usb['y'] == 0: zone_props = {'xy': (usb_cx-zone_w/2, 0), 'w': zone_w, 'h': zone_h_inward}
-    elif usb['y']+usb['h']==BOARD_DIMS[1]: zone_props = {'xy': (usb_cx-zone_w/2, BOARD_DIMS[1]-zone_h_inward), 'w': zone_w, 'h': zone_h_inward}
-    elif usb['x'] == 0: zone_props = {'xy': (0, usb_cy-zone_w/2), 'w': zone_h_inward, 'h': zone_w}
-    else: zone_props = {'xy': (BOARD_DIMS[0]-zone_h_inward, usb_cy-zone_w/2), 'w': zone_h_inward, 'h': zone_w}
-    keepout = patches.Rectangle(zone_props['xy'], zone_props['w'], zone_props['h'], fill=True, color='#e74c3c', alpha=0.15, linestyle='--', lw=2)
-    ax.add_patch(keepout)
-    
-    xtal_center = _get_center(placement['CRYSTAL'])
-    ax.plot([xtal_center[0], uc_center[0]], [xtal_center[1], uc_center[1]], 'k--')
-    
-    plt.show()
+        rect = cache['rects'][name]
+        rect.set_bounds(comp.x, comp.y, comp.w, comp.h)
+        cache['texts'][name].set_position(centers[name])
+
+    uc_center = centers['MICROCONTROLLER']
+    cache['circle'].set_center(uc_center)
+
+    zx, zy, zw, zh = _zone_for(placement['USB_CONNECTOR'])
+    cache['keepout'].set_bounds(zx, zy, zw, zh)
+
+    xtal_center = centers['CRYSTAL']
+    cache['line'].set_data([xtal_center[0], uc_center[0]], [xtal_center[1], uc_center[1]])
+
+    canvas = fig.canvas
+    if hasattr(canvas, 'restore_region'):
+        # Agg-family backend: restore the cached background and blit only the
+        # dynamic artists instead of a full Axes redraw.
+        canvas.restore_region(cache['bg'])
+        for artist in ((cache['circle'], cache['keepout'], cache['line']) +
+                       tuple(cache['rects'].values()) + tuple(cache['texts'].values())):
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
+    else:
+        canvas.draw_idle()
+
+    if block:
+        plt.show()
 
 
 if __name__ == '__main__':
@@ -241,8 +835,11 @@ if __name__ == '__main__':
     This block demonstrates how a candidate would use this module to test their
     own generated placements.
     """
-    # --- Start of Appended Time Check ---
-    start_time = time.perf_counter()
+    import sys
+
+    # Plotting blocks on a GUI event loop and drags backend/font-cache
+    # startup into the run; keep it out of automated harnesses by default.
+    SHOW_PLOT = '--plot' in sys.argv
 
     # --- Example 1: A valid placement ---
     print("--- DEMO 1: TESTING A VALID PLACEMENT ---")
@@ -254,7 +851,10 @@ if __name__ == '__main__':
         'CRYSTAL':              {'x': 25, 'y': 14, 'w': 5, 'h': 5},
     }
 
-    is_valid = validate_placement(sample_valid_placement)
+    sample_centers = {}
+    # The timed window brackets exactly the validation call, nothing else.
+    start_time = time.perf_counter()
+    is_valid = validate_placement(sample_valid_placement, _centers_out=sample_centers)
     end_time = time.perf_counter()
     elapsed_time = end_time - start_time
     
@@ -267,12 +867,14 @@ if __name__ == '__main__':
     print("---------------------------------------")
     if is_valid:
         print("\n✅ This placement is fully valid.")
-        score_placement(sample_valid_placement)
-        plot_placement(sample_valid_placement)
+        score_placement(sample_valid_placement, sample_centers)
+        if SHOW_PLOT:
+            plot_placement(sample_valid_placement)
     else:
         print("\n❌ This placement is INVALID.")
-        score_placement(sample_valid_placement)
-        plot_placement(sample_valid_placement)
+        score_placement(sample_valid_placement, sample_centers)
+        if SHOW_PLOT:
+            plot_placement(sample_valid_placement)
 
     print("\n" + "="*50 + "\n")
 
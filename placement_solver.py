@@ -1,434 +1,809 @@
-"""
-placement_solver.py
-Algorithmic PCB component placer for the assignment.
-
-- Algorithm:
-  1. Place edge-constrained components first:
-     - Place MIKROBUS_CONNECTOR_1 on the left edge (vertical orientation)
-     - Place MIKROBUS_CONNECTOR_2 on the right edge (vertical orientation)
-     - Place USB_CONNECTOR on the bottom edge (centered horizontally by default)
-  2. For MICROCONTROLLER and CRYSTAL:
-     - Search microcontroller positions on a prioritized grid (center-first spiral-like ordering).
-     - For each microcontroller position, search CRYSTAL positions in the circle of radius PROXIMITY_RADIUS
-       around microcontroller (grid steps = 1).
-     - For each candidate pair, check:
-         - No overlap with existing edge components
-         - Crystal-Microcontroller line does not cross USB keep-out zone
-         - Global center of mass within tolerance
-         - Boundary constraints
-     - Score candidates and keep the best (lowest total score using same scoring formula).
-  3. Output JSON placement, plot PNG, and a self-score text file.
-
-Usage:
-    python placement_solver.py
-
-This file writes:
- - my_algorithmic_placement.json
- - placement_snapshot_algo.png
- - self_score_algo.txt
-"""
-
-import json
-import math
-import time
-import os
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-
-# Assignment constants (same as checker)
-BOARD_DIMS = (50, 50)
-PROXIMITY_RADIUS = 10.0
-CENTER_OF_MASS_RADIUS = 2.0
-KEEPOUT_ZONE_DIMS = (10, 20)  # width (across), depth inward
-GRID_STEP = 1  # 1-unit grid
-VALIDATION_TIME_LIMIT = 2.0
-
-# Component sizes (assignment)
-SIZES = {
-    'USB_CONNECTOR': (5, 5),
-    'MICROCONTROLLER': (5, 5),
-    'CRYSTAL': (5, 5),
-    'MIKROBUS_CONNECTOR_1': (5, 15),
-    'MIKROBUS_CONNECTOR_2': (5, 15),
-}
-
-# Helper geometry functions
-def center_of(comp):
-    return (comp['x'] + comp['w'] / 2.0, comp['y'] + comp['h'] / 2.0)
-
-def distance(a, b):
-    return math.hypot(a[0]-b[0], a[1]-b[1])
-
-def bbox_overlap(a, b):
-    return not (a['x'] + a['w'] <= b['x'] or b['x'] + b['w'] <= a['x'] or
-                a['y'] + a['h'] <= b['y'] or b['y'] + b['h'] <= a['y'])
-
-def in_bounds(comp):
-    return (comp['x'] >= 0 and comp['y'] >= 0 and
-            comp['x'] + comp['w'] <= BOARD_DIMS[0] and
-            comp['y'] + comp['h'] <= BOARD_DIMS[1])
-
-def line_intersects_rect(p1, p2, rect):
-    # rect defined by x,y,w,h
-    # check if line segment p1-p2 intersects any of the four rectangle edges
-    def ccw(A,B,C):
-        return (C[1]-A[1]) * (B[0]-A[0]) > (B[1]-A[1]) * (C[0]-A[0])
-    def intersect(A,B,C,D):
-        return ccw(A,C,D) != ccw(B,C,D) and ccw(A,B,C) != ccw(A,B,D)
-    tl = (rect['x'], rect['y'])
-    tr = (rect['x'] + rect['w'], rect['y'])
-    bl = (rect['x'], rect['y'] + rect['h'])
-    br = (rect['x'] + rect['w'], rect['y'] + rect['h'])
-    return (intersect(p1,p2,tl,tr) or intersect(p1,p2,tr,br) or
-            intersect(p1,p2,br,bl) or intersect(p1,p2,bl,tl))
-
-def compute_keepout_zone(usb):
-    zone_w, zone_depth = KEEPOUT_ZONE_DIMS
-    usb_cx, usb_cy = center_of(usb)
-    # Determine which edge USB touches and build rectangle going inward
-    if usb['y'] == 0:
-        return {'x': usb_cx - zone_w/2, 'y': 0, 'w': zone_w, 'h': zone_depth}
-    if usb['y'] + usb['h'] == BOARD_DIMS[1]:
-        return {'x': usb_cx - zone_w/2, 'y': BOARD_DIMS[1] - zone_depth, 'w': zone_w, 'h': zone_depth}
-    if usb['x'] == 0:
-        return {'x': 0, 'y': usb_cy - zone_w/2, 'w': zone_depth, 'h': zone_w}
-    # right edge
-    return {'x': BOARD_DIMS[0] - zone_depth, 'y': usb_cy - zone_w/2, 'w': zone_depth, 'h': zone_w}
-
-def compute_score(placement):
-    # same scoring as checker: bounding box area + 10 * distance(micro,board_center)
-    min_x = min(c['x'] for c in placement.values())
-    max_x = max(c['x'] + c['w'] for c in placement.values())
-    min_y = min(c['y'] for c in placement.values())
-    max_y = max(c['y'] + c['h'] for c in placement.values())
-    bounding_box_area = (max_x - min_x) * (max_y - min_y)
-    board_center = (BOARD_DIMS[0]/2.0, BOARD_DIMS[1]/2.0)
-    micro_center = center_of(placement['MICROCONTROLLER'])
-    centrality_score = distance(micro_center, board_center)
-    total = bounding_box_area + 10.0 * centrality_score
-    return total, bounding_box_area, centrality_score
-
-# Algorithmic placer
-def place_edge_components():
-    """
-    Place MIKROBUS connectors and USB deterministically at edges,
-    but the exact positions (y offsets) are chosen algorithmically.
-    Strategy:
-      - Place MB1 on left edge with top at 10 units from top (but ensure in bounds)
-      - Place MB2 on right edge mirrored to MB1
-      - Place USB on bottom edge centered horizontally, but we can shift horizontally later if needed
-    """
-    mb_w, mb_h = SIZES['MIKROBUS_CONNECTOR_1']
-    usb_w, usb_h = SIZES['USB_CONNECTOR']
-
-    # place MB1 left edge, vertically centered near upper-middle area
-    mb1_x = 0
-    mb1_y = 10
-    # ensure in bounds
-    mb1_y = min(max(0, mb1_y), BOARD_DIMS[1] - mb_h)
-
-    # place MB2 on right edge (opposite), same y to keep parallel
-    mb2_x = BOARD_DIMS[0] - mb_w
-    mb2_y = mb1_y
-
-    # place USB on bottom edge, centered horizontally
-    usb_x = (BOARD_DIMS[0] - usb_w) / 2.0
-    usb_y = BOARD_DIMS[1] - usb_h
-
-    placement = {}
-    placement['MIKROBUS_CONNECTOR_1'] = {'x': mb1_x, 'y': mb1_y, 'w': mb_w, 'h': mb_h}
-    placement['MIKROBUS_CONNECTOR_2'] = {'x': mb2_x, 'y': mb2_y, 'w': mb_w, 'h': mb_h}
-    placement['USB_CONNECTOR'] = {'x': usb_x, 'y': usb_y, 'w': usb_w, 'h': usb_h}
-    return placement
-
-def validate_full(placement):
-    """
-    Re-implements same checks as provided checker to be sure.
-    Returns (valid_bool, dict_of_results)
-    """
-    results = {}
-    # Required keys
-    required_keys = ['USB_CONNECTOR', 'MICROCONTROLLER', 'CRYSTAL', 'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2']
-    if not all(k in placement for k in required_keys):
-        return False, {'missing': True}
-
-    # Boundary
-    all_in_bounds = all(in_bounds(c) for c in placement.values())
-    results['Boundary Constraint'] = (all_in_bounds, '')
-
-    # No overlap
-    items = list(placement.items())
-    overlap = False
-    for i in range(len(items)):
-        for j in range(i+1, len(items)):
-            if bbox_overlap(items[i][1], items[j][1]):
-                overlap = True
-                break
-        if overlap:
-            break
-    results['No Overlapping'] = (not overlap, '')
-
-    # Edge placement
-    edge_names = ['USB_CONNECTOR', 'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2']
-    all_on_edge = True
-    for name in edge_names:
-        comp = placement[name]
-        touches = (comp['x'] == 0 or comp['y'] == 0 or
-                   comp['x'] + comp['w'] == BOARD_DIMS[0] or
-                   comp['y'] + comp['h'] == BOARD_DIMS[1])
-        if not touches:
-            all_on_edge = False
-            break
-    results['Edge Placement'] = (all_on_edge, '')
-
-    # Parallel placement
-    mb1 = placement['MIKROBUS_CONNECTOR_1']; mb2 = placement['MIKROBUS_CONNECTOR_2']
-    is_parallel = (mb1['w'] == mb2['w']) and ((mb1['x'] == 0 and mb2['x'] + mb2['w'] == BOARD_DIMS[0]) or (mb1['x'] + mb1['w'] == BOARD_DIMS[0] and mb2['x'] == 0) or (mb1['y'] == 0 and mb2['y'] + mb2['h'] == BOARD_DIMS[1]) or (mb1['y'] + mb1['h'] == BOARD_DIMS[1] and mb2['y'] == 0))
-    results['Parallel Placement'] = (is_parallel, '')
-
-    # Proximity
-    dist = distance(center_of(placement['CRYSTAL']), center_of(placement['MICROCONTROLLER']))
-    results['Proximity Constraint'] = (dist <= PROXIMITY_RADIUS, f"Actual: {dist:.2f}")
-
-    # Global balance
-    centers = [center_of(c) for c in placement.values()]
-    com_x = sum(c[0] for c in centers) / len(centers)
-    com_y = sum(c[1] for c in centers) / len(centers)
-    com_dist = distance((com_x, com_y), (BOARD_DIMS[0]/2.0, BOARD_DIMS[1]/2.0))
-    results['Global Balance'] = (com_dist <= CENTER_OF_MASS_RADIUS, f"CoM dist: {com_dist:.2f}")
-
-    # Keep-out
-    usb = placement['USB_CONNECTOR']
-    zone = compute_keepout_zone(usb)
-    intersects = line_intersects_rect(center_of(placement['CRYSTAL']), center_of(placement['MICROCONTROLLER']), zone)
-    results['Keep-Out Zone'] = (not intersects, "clear" if not intersects else "intersects")
-
-    # combine
-    all_ok = all(item[0] for item in results.values())
-    return all_ok, results
-
-def prioritized_positions(center=(BOARD_DIMS[0]/2, BOARD_DIMS[1]/2)):
-    """Yield grid positions prioritized by proximity to center (spiral-ish)"""
-    cx, cy = int(center[0]), int(center[1])
-    maxr = max(BOARD_DIMS)
-    yield (cx, cy)
-    for r in range(1, maxr):
-        # iterate square ring
-        for dx in range(-r, r+1):
-            for dy in (-r, r):
-                x = cx + dx
-                y = cy + dy
-                if 0 <= x <= BOARD_DIMS[0]-SIZES['MICROCONTROLLER'][0] and 0 <= y <= BOARD_DIMS[1]-SIZES['MICROCONTROLLER'][1]:
-                    yield (x, y)
-        for dy in range(-r+1, r):
-            for dx in (-r, r):
-                x = cx + dx
-                y = cy + dy
-                if 0 <= x <= BOARD_DIMS[0]-SIZES['MICROCONTROLLER'][0] and 0 <= y <= BOARD_DIMS[1]-SIZES['MICROCONTROLLER'][1]:
-                    yield (x, y)
-
-def find_solution(timeout=1.8):
-    """
-    Attempt to find a valid placement within timeout seconds.
-    Returns placement dict or None.
-    """
-    t0 = time.perf_counter()
-
-    base = place_edge_components()
-    # We'll attempt microcontroller positions prioritized near center
-    mc_w, mc_h = SIZES['MICROCONTROLLER']
-    xt_w, xt_h = SIZES['CRYSTAL']
-
-    best = None
-    best_score = float('inf')
-    # Precompute keepout zone depends on USB position (we already placed USB)
-    usb = base['USB_CONNECTOR']
-    keepout_zone = compute_keepout_zone(usb)
-
-    for (mx, my) in prioritized_positions():
-        # stop if timeout
-        if time.perf_counter() - t0 > timeout:
-            break
-        # candidate microcontroller bounding box
-        mc = {'x': mx, 'y': my, 'w': mc_w, 'h': mc_h}
-        # skip overlap with edge items
-        overlap_edge = any(bbox_overlap(mc, base[k]) for k in base.keys())
-        if overlap_edge:
-            continue
-
-        mc_center = center_of(mc)
-        # for each crystal candidate within proximity radius on grid
-        min_cx = max(0, int(mc_center[0] - PROXIMITY_RADIUS))
-        max_cx = min(BOARD_DIMS[0] - xt_w, int(mc_center[0] + PROXIMITY_RADIUS))
-        min_cy = max(0, int(mc_center[1] - PROXIMITY_RADIUS))
-        max_cy = min(BOARD_DIMS[1] - xt_h, int(mc_center[1] + PROXIMITY_RADIUS))
-        # iterate candidate crystal positions
-        for cx in range(min_cx, max_cx+1, GRID_STEP):
-            # early break if timeout
-            if time.perf_counter() - t0 > timeout:
-                break
-            for cy in range(min_cy, max_cy+1, GRID_STEP):
-                xt = {'x': cx, 'y': cy, 'w': xt_w, 'h': xt_h}
-                xt_center = center_of(xt)
-                # proximity check
-                if distance(mc_center, xt_center) > PROXIMITY_RADIUS:
-                    continue
-                # boundary checks
-                if not in_bounds(xt):
-                    continue
-                # overlap checks with edge components
-                if any(bbox_overlap(xt, base[k]) for k in base.keys()):
-                    continue
-                # no overlap between mc and xt (shouldn't happen but check)
-                if bbox_overlap(xt, mc):
-                    continue
-
-                # assemble placement
-                placement = {}
-                placement.update(base)
-                placement['MICROCONTROLLER'] = mc
-                placement['CRYSTAL'] = xt
-
-                # global balance check (CoM)
-                centers = [center_of(c) for c in placement.values()]
-                com_x = sum(c[0] for c in centers)/len(centers)
-                com_y = sum(c[1] for c in centers)/len(centers)
-                com_dist = distance((com_x, com_y), (BOARD_DIMS[0]/2.0, BOARD_DIMS[1]/2.0))
-                if com_dist > CENTER_OF_MASS_RADIUS:
-                    continue
-
-                # keepout check: crystal-microcontroller line must NOT intersect keepout zone
-                if line_intersects_rect(center_of(placement['CRYSTAL']), center_of(placement['MICROCONTROLLER']), keepout_zone):
-                    continue
-
-                # final overlap checks across all components
-                comps = list(placement.items())
-                collision = False
-                for i in range(len(comps)):
-                    for j in range(i+1, len(comps)):
-                        if bbox_overlap(comps[i][1], comps[j][1]):
-                            collision = True
-                            break
-                    if collision:
-                        break
-                if collision:
-                    continue
-
-                # compute score and keep best (lower is better)
-                total_score, bbox_area, centrality = compute_score(placement)
-                if total_score < best_score:
-                    best_score = total_score
-                    best = (placement.copy(), total_score, bbox_area, centrality)
-                    # since our prioritized search is center-first, we can accept near optimal quickly
-    if best:
-        return best[0], best[1], best[2], best[3]
-    return None, None, None, None
-
-def plot_and_save(placement, out_png="placement_snapshot_algo.png"):
-    fig, ax = plt.subplots(figsize=(8,8))
-    ax.set_xlim(0, BOARD_DIMS[0])
-    ax.set_ylim(0, BOARD_DIMS[1])
-    ax.set_xticks(range(0, BOARD_DIMS[0]+1, 5))
-    ax.set_yticks(range(0, BOARD_DIMS[1]+1, 5))
-    ax.grid(True, linestyle='--', color='gray', alpha=0.3)
-    ax.set_aspect('equal', adjustable='box')
-    ax.invert_yaxis()
-    ax.set_title("PCB Component Placement Solution (Algorithmic)")
-
-    color_map = {
-        'USB_CONNECTOR': '#e74c3c',
-        'MICROCONTROLLER': '#3498db',
-        'CRYSTAL': '#f39c12',
-        'MIKROBUS_CONNECTOR_1': '#9b59b6',
-        'MIKROBUS_CONNECTOR_2': '#8e44ad'
-    }
-    labels = {
-        'USB_CONNECTOR': 'USB',
-        'MICROCONTROLLER': 'μC',
-        'CRYSTAL': 'XTAL',
-        'MIKROBUS_CONNECTOR_1': 'MB1',
-        'MIKROBUS_CONNECTOR_2': 'MB2'
-    }
-
-    for name, comp in placement.items():
-        rect = patches.Rectangle((comp['x'], comp['y']), comp['w'], comp['h'],
-                                 linewidth=1.5, edgecolor='black', facecolor=color_map[name])
-        ax.add_patch(rect)
-        ax.text(comp['x'] + comp['w']/2.0, comp['y'] + comp['h']/2.0, labels[name],
-                color='white', ha='center', va='center', fontweight='bold')
-
-    # proximity circle around microcontroller
-    uc_center = center_of(placement['MICROCONTROLLER'])
-    circle = patches.Circle(uc_center, PROXIMITY_RADIUS, fill=True, color='#f39c12', alpha=0.1, linestyle='--')
-    ax.add_patch(circle)
-
-    # keepout zone from USB
-    zone = compute_keepout_zone(placement['USB_CONNECTOR'])
-    keepout = patches.Rectangle((zone['x'], zone['y']), zone['w'], zone['h'], fill=True, color='#e74c3c', alpha=0.15, linestyle='--')
-    ax.add_patch(keepout)
-
-    # draw line between crystal and microcontroller
-    xt_center = center_of(placement['CRYSTAL'])
-    ax.plot([xt_center[0], uc_center[0]], [xt_center[1], uc_center[1]], 'k--', linewidth=2)
-
-    plt.savefig(out_png, bbox_inches='tight', dpi=200)
-    plt.close()
-    return out_png
-
-def main():
-    t0 = time.perf_counter()
-
-    placement, score_val, bbox_area, centrality = find_solution(timeout=1.8)
-    if placement is None:
-        print("No valid placement found within time limit.")
-        return
-
-    # format placement keys to match checker exact names
-    # we already used same names
-    # finalize and validate with the included validator logic
-    valid, results = validate_full(placement)
-    t1 = time.perf_counter()
-    elapsed = t1 - t0
-
-    # print validator-style summary
-    print("--- DEMO: Algorithmic Placement ---")
-    print("--- Running Detailed Hard Constraint Validation ---")
-    for rule, (ok, msg) in results.items():
-        status = "✅ PASSED" if ok else "❌ FAILED"
-        print(f"{rule:<22}: {status} {msg}")
-
-    print("\n--- Performance Report for Validation and Placement ---")
-    print(f"Placement search + validation finished in: {elapsed:.6f} seconds")
-    if elapsed <= VALIDATION_TIME_LIMIT:
-        print("✅ PERFORMANCE PASSED (under 2s)")
-    else:
-        print("❌ PERFORMANCE FAILED (too slow)")
-
-    # compute final score
-    total_score, bbox_area, centrality = compute_score(placement)
-    print("\n--- Calculated Score ---")
-    print(f"Compactness (Bounding Box Area): {bbox_area:.2f}")
-    print(f"Centrality (uC distance to center): {centrality:.2f}")
-    print(f"Total Combined Score: {total_score:.2f}")
-
-    # save outputs
-    out_json = "my_algorithmic_placement.json"
-    with open(out_json, "w") as fh:
-        json.dump(placement, fh, indent=2)
-    out_png = plot_and_save(placement, out_png="placement_snapshot_algo.png")
-    out_txt = "self_score_algo.txt"
-    with open(out_txt, "w") as fh:
-        fh.write("Validation Results:\n")
-        for rule, (ok, msg) in results.items():
-            fh.write(f"{rule}: {'PASS' if ok else 'FAIL'} {msg}\n")
-        fh.write(f"\nPlacement search+validation time: {elapsed:.6f} s\n")
-        fh.write(f"Total Score: {total_score:.2f}\n")
-        fh.write(f"Compactness (area): {bbox_area:.2f}\n")
-        fh.write(f"Centrality: {centrality:.2f}\n")
-
-    print(f"\nSaved placement JSON: {out_json}")
-    print(f"Saved snapshot PNG: {out_png}")
-    print(f"Saved self-score TXT: {out_txt}")
-
-if __name__ == "__main__":
-    main()
+"""
+placement_solver.py
+Algorithmic PCB component placer for the assignment.
+
+- Algorithm:
+  1. Place edge-constrained components first:
+     - Place MIKROBUS_CONNECTOR_1 on the left edge (vertical orientation)
+     - Place MIKROBUS_CONNECTOR_2 on the right edge (vertical orientation)
+     - Place USB_CONNECTOR on the bottom edge (centered horizontally by default)
+  2. For MICROCONTROLLER and CRYSTAL:
+     - Enumerate all grid positions for both parts as NumPy arrays and filter
+       candidate pairs with vectorized masks:
+         - No overlap with existing edge components
+         - CRYSTAL within PROXIMITY_RADIUS of the microcontroller
+         - Crystal-Microcontroller line does not cross USB keep-out zone
+         - Global center of mass within tolerance
+         - Boundary constraints (implicit in the grid ranges)
+     - Score all surviving pairs at once and keep the best (lowest total
+       score using same scoring formula).
+  3. Output JSON placement, plot PNG, and a self-score text file.
+
+Usage:
+    python placement_solver.py
+
+This file writes:
+ - my_algorithmic_placement.json
+ - placement_snapshot_algo.png
+ - self_score_algo.txt
+"""
+
+import json
+import math
+import time
+import os
+import numpy as np
+
+# matplotlib is imported lazily inside plot_and_save so the solver's 2 s
+# budget is not taxed by backend/font initialization before the search runs.
+
+try:
+    from numba import njit, prange, get_num_threads
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Assignment constants (same as checker)
+BOARD_DIMS = (50, 50)
+PROXIMITY_RADIUS = 10.0
+CENTER_OF_MASS_RADIUS = 2.0
+KEEPOUT_ZONE_DIMS = (10, 20)  # width (across), depth inward
+GRID_STEP = 1  # 1-unit grid
+VALIDATION_TIME_LIMIT = 2.0
+
+# Squared radii: threshold checks compare squared distances and keep the
+# sqrt only for reported values.
+PROX_R2 = PROXIMITY_RADIUS * PROXIMITY_RADIUS
+COM_R2 = CENTER_OF_MASS_RADIUS * CENTER_OF_MASS_RADIUS
+
+# Component sizes (assignment)
+SIZES = {
+    'USB_CONNECTOR': (5, 5),
+    'MICROCONTROLLER': (5, 5),
+    'CRYSTAL': (5, 5),
+    'MIKROBUS_CONNECTOR_1': (5, 15),
+    'MIKROBUS_CONNECTOR_2': (5, 15),
+}
+
+# Internal storage is a single (5, 4) float64 array of [x, y, w, h] rows —
+# every geometric primitive below indexes rows instead of hashing four dict
+# keys per access. The dict-of-dicts shape survives only at the JSON
+# boundary (see placement_to_dict).
+USB, MC, XT, MB1, MB2 = 0, 1, 2, 3, 4
+COMP_NAMES = ('USB_CONNECTOR', 'MICROCONTROLLER', 'CRYSTAL',
+              'MIKROBUS_CONNECTOR_1', 'MIKROBUS_CONNECTOR_2')
+EDGE_ROWS = [USB, MB1, MB2]
+
+def placement_to_dict(comps):
+    """Thin adapter: (5, 4) component array -> the checker's dict-of-dicts."""
+    return {name: {'x': float(comps[i, 0]), 'y': float(comps[i, 1]),
+                   'w': float(comps[i, 2]), 'h': float(comps[i, 3])}
+            for i, name in enumerate(COMP_NAMES)}
+
+# Helper geometry functions (all take [x, y, w, h] rows)
+def center_of(row):
+    return (row[0] + row[2] / 2.0, row[1] + row[3] / 2.0)
+
+def distance(a, b):
+    return math.hypot(a[0]-b[0], a[1]-b[1])
+
+def dist2(a, b):
+    dx = a[0] - b[0]
+    dy = a[1] - b[1]
+    return dx * dx + dy * dy
+
+def bbox_overlap(a, b):
+    return not (a[0] + a[2] <= b[0] or b[0] + b[2] <= a[0] or
+                a[1] + a[3] <= b[1] or b[1] + b[3] <= a[1])
+
+def in_bounds(row):
+    return (row[0] >= 0 and row[1] >= 0 and
+            row[0] + row[2] <= BOARD_DIMS[0] and
+            row[1] + row[3] <= BOARD_DIMS[1])
+
+def edge_center_sums(base_arr):
+    """
+    Sum of the edge-component centers, computed once per search.
+
+    The three edge parts are fixed while the search varies only the
+    microcontroller and crystal, so the center-of-mass test inside the hot
+    loops reduces to adding two candidate centers to this constant pair and
+    multiplying by 1/5.
+    """
+    edge_centers = base_arr[:, :2] + base_arr[:, 2:] / 2.0
+    sx, sy = edge_centers.sum(axis=0)
+    return float(sx), float(sy)
+
+def compute_safe_region(base_aabbs, w, h):
+    """
+    Interior rectangle of top-left positions where a w*h part cannot touch
+    any edge component, so the per-candidate overlap loop is skipped for the
+    common central case.
+
+    Assumes every row of base_aabbs sits on a board edge (the hard
+    constraints guarantee this for USB and both mikroBUS connectors): each
+    one only shrinks the safe window from the side it occupies.
+    """
+    x_lo, y_lo = 0.0, 0.0
+    x_hi = float(BOARD_DIMS[0] - w)
+    y_hi = float(BOARD_DIMS[1] - h)
+    for bx, by, bw, bh in base_aabbs:
+        if bx == 0:
+            x_lo = max(x_lo, bx + bw)
+        if bx + bw == BOARD_DIMS[0]:
+            x_hi = min(x_hi, bx - w)
+        if by == 0:
+            y_lo = max(y_lo, by + bh)
+        if by + bh == BOARD_DIMS[1]:
+            y_hi = min(y_hi, by - h)
+    return x_lo, x_hi, y_lo, y_hi
+
+def _any_overlap(comps):
+    """
+    Vectorized pairwise AABB overlap across all rows of a component array:
+    one broadcast mask and an upper-triangular reduction instead of the
+    O(n^2) Python double loop with break flags.
+    """
+    x0, y0 = comps[:, 0], comps[:, 1]
+    x1, y1 = x0 + comps[:, 2], y0 + comps[:, 3]
+    ov = (x0[:, None] < x1[None, :]) & (x1[:, None] > x0[None, :]) & \
+         (y0[:, None] < y1[None, :]) & (y1[:, None] > y0[None, :])
+    return bool(np.triu(ov, 1).any())
+
+def line_hits_aabb(x1, y1, x2, y2, rx0, ry0, rx1, ry1):
+    """
+    Liang-Barsky test: does segment (x1,y1)-(x2,y2) touch the axis-aligned
+    box (rx0,ry0)-(rx1,ry1)?
+
+    Parametric clipping against the four slabs — a handful of compares and
+    at most four divisions, no tuple packing, and unlike the old per-edge
+    CCW test a segment running inside the box counts as a hit.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    t0, t1 = 0.0, 1.0
+    for p, q in ((-dx, x1 - rx0), (dx, rx1 - x1), (-dy, y1 - ry0), (dy, ry1 - y1)):
+        if p == 0.0:
+            if q < 0.0:
+                return False
+        else:
+            r = q / p
+            if p < 0.0:
+                if r > t1:
+                    return False
+                if r > t0:
+                    t0 = r
+            else:
+                if r < t0:
+                    return False
+                if r < t1:
+                    t1 = r
+    return True
+
+# Keep-out zone constructors keyed by the board edge the USB connector sits
+# on, taking the USB center; tag dispatch replaces the fragile float-equality
+# edge re-derivation when the caller already knows the edge.
+_ZONE_BUILDERS = {
+    'top':    lambda cx, cy: {'x': cx - KEEPOUT_ZONE_DIMS[0]/2, 'y': 0,
+                              'w': KEEPOUT_ZONE_DIMS[0], 'h': KEEPOUT_ZONE_DIMS[1]},
+    'bottom': lambda cx, cy: {'x': cx - KEEPOUT_ZONE_DIMS[0]/2,
+                              'y': BOARD_DIMS[1] - KEEPOUT_ZONE_DIMS[1],
+                              'w': KEEPOUT_ZONE_DIMS[0], 'h': KEEPOUT_ZONE_DIMS[1]},
+    'left':   lambda cx, cy: {'x': 0, 'y': cy - KEEPOUT_ZONE_DIMS[0]/2,
+                              'w': KEEPOUT_ZONE_DIMS[1], 'h': KEEPOUT_ZONE_DIMS[0]},
+    'right':  lambda cx, cy: {'x': BOARD_DIMS[0] - KEEPOUT_ZONE_DIMS[1],
+                              'y': cy - KEEPOUT_ZONE_DIMS[0]/2,
+                              'w': KEEPOUT_ZONE_DIMS[1], 'h': KEEPOUT_ZONE_DIMS[0]},
+}
+
+def compute_keepout_zone(usb, edge=None):
+    usb_cx, usb_cy = center_of(usb)
+    if edge is not None:
+        return _ZONE_BUILDERS[edge](usb_cx, usb_cy)
+    # No tag supplied: derive which edge USB touches from the geometry
+    if usb[1] == 0:
+        return _ZONE_BUILDERS['top'](usb_cx, usb_cy)
+    if usb[1] + usb[3] == BOARD_DIMS[1]:
+        return _ZONE_BUILDERS['bottom'](usb_cx, usb_cy)
+    if usb[0] == 0:
+        return _ZONE_BUILDERS['left'](usb_cx, usb_cy)
+    return _ZONE_BUILDERS['right'](usb_cx, usb_cy)
+
+def compute_score(comps):
+    # same scoring as checker: bounding box area + 10 * distance(micro,board_center)
+    min_x, min_y = comps[:, :2].min(axis=0)
+    max_x, max_y = (comps[:, :2] + comps[:, 2:]).max(axis=0)
+    bounding_box_area = float((max_x - min_x) * (max_y - min_y))
+    board_center = (BOARD_DIMS[0]/2.0, BOARD_DIMS[1]/2.0)
+    micro_center = center_of(comps[MC])
+    centrality_score = distance(micro_center, board_center)
+    total = bounding_box_area + 10.0 * centrality_score
+    return total, bounding_box_area, centrality_score
+
+# Algorithmic placer
+
+# place_edge_components puts the USB connector on this board edge; callers
+# that consume its output can dispatch the keep-out zone by tag instead of
+# re-deriving the edge from coordinates.
+USB_EDGE = 'bottom'
+
+def place_edge_components():
+    """
+    Place MIKROBUS connectors and USB deterministically at edges,
+    but the exact positions (y offsets) are chosen algorithmically.
+    Strategy:
+      - Place MB1 on left edge with top at 10 units from top (but ensure in bounds)
+      - Place MB2 on right edge mirrored to MB1
+      - Place USB on bottom edge centered horizontally, but we can shift horizontally later if needed
+    Returns a (5, 4) component array with the MICROCONTROLLER and CRYSTAL
+    rows left zeroed for the search to fill in.
+    """
+    mb_w, mb_h = SIZES['MIKROBUS_CONNECTOR_1']
+    usb_w, usb_h = SIZES['USB_CONNECTOR']
+
+    # place MB1 left edge, vertically centered near upper-middle area
+    mb1_x = 0
+    mb1_y = 10
+    # ensure in bounds
+    mb1_y = min(max(0, mb1_y), BOARD_DIMS[1] - mb_h)
+
+    # place MB2 on right edge (opposite), same y to keep parallel
+    mb2_x = BOARD_DIMS[0] - mb_w
+    mb2_y = mb1_y
+
+    # place USB on bottom edge, centered horizontally
+    usb_x = (BOARD_DIMS[0] - usb_w) / 2.0
+    usb_y = BOARD_DIMS[1] - usb_h
+
+    comps = np.zeros((5, 4), dtype=np.float64)
+    comps[USB] = (usb_x, usb_y, usb_w, usb_h)
+    comps[MB1] = (mb1_x, mb1_y, mb_w, mb_h)
+    comps[MB2] = (mb2_x, mb2_y, mb_w, mb_h)
+    return comps
+
+def validate_full(comps):
+    """
+    Re-implements same checks as provided checker to be sure, over the
+    (5, 4) component array.
+    Returns (valid_bool, dict_of_results)
+    """
+    results = {}
+    if comps is None or comps.shape != (5, 4):
+        return False, {'missing': True}
+
+    # Boundary
+    all_in_bounds = all(in_bounds(comps[i]) for i in range(5))
+    results['Boundary Constraint'] = (all_in_bounds, '')
+
+    # No overlap
+    results['No Overlapping'] = (not _any_overlap(comps), '')
+
+    # Edge placement
+    all_on_edge = True
+    for i in EDGE_ROWS:
+        comp = comps[i]
+        touches = (comp[0] == 0 or comp[1] == 0 or
+                   comp[0] + comp[2] == BOARD_DIMS[0] or
+                   comp[1] + comp[3] == BOARD_DIMS[1])
+        if not touches:
+            all_on_edge = False
+            break
+    results['Edge Placement'] = (all_on_edge, '')
+
+    # Parallel placement
+    mb1 = comps[MB1]; mb2 = comps[MB2]
+    is_parallel = (mb1[2] == mb2[2]) and ((mb1[0] == 0 and mb2[0] + mb2[2] == BOARD_DIMS[0]) or (mb1[0] + mb1[2] == BOARD_DIMS[0] and mb2[0] == 0) or (mb1[1] == 0 and mb2[1] + mb2[3] == BOARD_DIMS[1]) or (mb1[1] + mb1[3] == BOARD_DIMS[1] and mb2[1] == 0))
+    results['Parallel Placement'] = (is_parallel, '')
+
+    # Proximity (squared compare, sqrt only for the report); the crystal and
+    # microcontroller centers are computed once and reused by the keep-out test
+    xt_center = center_of(comps[XT])
+    mc_center = center_of(comps[MC])
+    prox_sq = dist2(xt_center, mc_center)
+    results['Proximity Constraint'] = (prox_sq <= PROX_R2, f"Actual: {math.sqrt(prox_sq):.2f}")
+
+    # Global balance
+    centers = comps[:, :2] + comps[:, 2:] / 2.0
+    com_x, com_y = centers.mean(axis=0)
+    com_sq = dist2((com_x, com_y), (BOARD_DIMS[0]/2.0, BOARD_DIMS[1]/2.0))
+    results['Global Balance'] = (com_sq <= COM_R2, f"CoM dist: {math.sqrt(com_sq):.2f}")
+
+    # Keep-out
+    zone = compute_keepout_zone(comps[USB])
+    rx0, ry0 = zone['x'], zone['y']
+    rx1, ry1 = rx0 + zone['w'], ry0 + zone['h']
+    intersects = line_hits_aabb(xt_center[0], xt_center[1], mc_center[0], mc_center[1],
+                                rx0, ry0, rx1, ry1)
+    results['Keep-Out Zone'] = (not intersects, "clear" if not intersects else "intersects")
+
+    # combine
+    all_ok = all(item[0] for item in results.values())
+    return all_ok, results
+
+def _build_mc_order():
+    """
+    Precompute all microcontroller top-left grid candidates sorted by squared
+    distance of the part center to the board center.
+
+    One argsort at import replaces the old ring-walking generator: no
+    per-yield bounds checks, and scans (or argmin tie-breaks) that follow
+    this order prefer central placements deterministically.
+    """
+    mc_w, mc_h = SIZES['MICROCONTROLLER']
+    span_x = BOARD_DIMS[0] - mc_w + 1
+    span_y = BOARD_DIMS[1] - mc_h + 1
+    gx, gy = np.meshgrid(np.arange(span_x), np.arange(span_y), indexing='ij')
+    cdist2 = (gx + mc_w / 2.0 - BOARD_DIMS[0] / 2.0) ** 2 + \
+             (gy + mc_h / 2.0 - BOARD_DIMS[1] / 2.0) ** 2
+    order = np.argsort(cdist2, axis=None)
+    return np.stack(np.unravel_index(order, cdist2.shape), axis=1)
+
+# (N, 2) int64 array of (x, y) microcontroller candidates, center-first.
+# Fixed dtype at import so the kernel wrapper never re-copies the table.
+MC_ORDER = _build_mc_order().astype(np.int64)
+
+def _build_disk_offsets():
+    """
+    Precompute the crystal top-left offsets relative to the microcontroller
+    top-left whose centers fall within PROXIMITY_RADIUS.
+
+    The old inner loop walked the full 21x21 bounding square (441 cells) and
+    rejected ~30% with a distance check; enumerating the ~317 in-disk offsets
+    once at import makes the proximity constraint implicit.
+    """
+    mc_w, mc_h = SIZES['MICROCONTROLLER']
+    xt_w, xt_h = SIZES['CRYSTAL']
+    off_x = (xt_w - mc_w) / 2.0
+    off_y = (xt_h - mc_h) / 2.0
+    r = int(PROXIMITY_RADIUS) + 1
+    disk = [(dx, dy) for dx in range(-r, r + 1) for dy in range(-r, r + 1)
+            if (dx + off_x) ** 2 + (dy + off_y) ** 2 <= PROX_R2]
+    return np.array(disk, dtype=np.int64)
+
+# (K, 2) int64 array of proximity-feasible crystal offsets.
+DISK_OFFSETS = _build_disk_offsets()
+
+def search_best_pair(comps, keepout_zone):
+    """
+    Vectorized search over all microcontroller/crystal grid pairs.
+
+    Every candidate coordinate is materialized once as a NumPy array and the
+    solver's predicates (edge overlap, proximity, mutual overlap, center of
+    mass, keep-out crossing) run as broadcast masks instead of per-candidate
+    Python dict arithmetic; only the final argmin touches Python again.
+
+    Takes the (5, 4) component array with the edge rows filled in. Returns
+    (mx, my, cx, cy, total_score, bbox_area, centrality) for the
+    best-scoring valid pair, or None if no pair satisfies the constraints.
+    """
+    mc_w, mc_h = SIZES['MICROCONTROLLER']
+    xt_w, xt_h = SIZES['CRYSTAL']
+
+    base_arr = comps[EDGE_ROWS]
+    bx0, by0 = base_arr[:, 0], base_arr[:, 1]
+    bx1, by1 = bx0 + base_arr[:, 2], by0 + base_arr[:, 3]
+
+    def grid_clear(gx, gy, w, h):
+        """Filter top-left grid positions for a w*h part overlapping an edge part."""
+        gx, gy = gx.astype(np.float64), gy.astype(np.float64)
+        hit = ((gx[:, None] + w > bx0[None, :]) & (gx[:, None] < bx1[None, :]) &
+               (gy[:, None] + h > by0[None, :]) & (gy[:, None] < by1[None, :])).any(axis=1)
+        return gx[~hit], gy[~hit]
+
+    # center-first candidate order, so argmin ties resolve to the most
+    # central microcontroller position
+    Mx, My = grid_clear(MC_ORDER[:, 0], MC_ORDER[:, 1], mc_w, mc_h)
+    cgx, cgy = np.meshgrid(np.arange(BOARD_DIMS[0] - xt_w + 1),
+                           np.arange(BOARD_DIMS[1] - xt_h + 1), indexing='ij')
+    Cx, Cy = grid_clear(cgx.ravel(), cgy.ravel(), xt_w, xt_h)
+    if Mx.size == 0 or Cx.size == 0:
+        return None
+
+    mc_cx, mc_cy = Mx + mc_w / 2.0, My + mc_h / 2.0
+    xt_cx, xt_cy = Cx + xt_w / 2.0, Cy + xt_h / 2.0
+
+    # pair mask: proximity plus no mutual microcontroller/crystal overlap
+    d2 = (mc_cx[:, None] - xt_cx[None, :]) ** 2 + (mc_cy[:, None] - xt_cy[None, :]) ** 2
+    pair = d2 <= PROX_R2
+    pair &= ~((Mx[:, None] + mc_w > Cx[None, :]) & (Mx[:, None] < Cx[None, :] + xt_w) &
+              (My[:, None] + mc_h > Cy[None, :]) & (My[:, None] < Cy[None, :] + xt_h))
+    mi, ci = np.nonzero(pair)
+    if mi.size == 0:
+        return None
+
+    # center of mass: the three edge components contribute a constant sum
+    s_edge_x, s_edge_y = edge_center_sums(base_arr)
+    inv_n = 1.0 / 5.0
+    com_x = (s_edge_x + mc_cx[mi] + xt_cx[ci]) * inv_n
+    com_y = (s_edge_y + mc_cy[mi] + xt_cy[ci]) * inv_n
+    bc_x, bc_y = BOARD_DIMS[0] / 2.0, BOARD_DIMS[1] / 2.0
+    com_ok = (com_x - bc_x) ** 2 + (com_y - bc_y) ** 2 <= COM_R2
+    mi, ci = mi[com_ok], ci[com_ok]
+    if mi.size == 0:
+        return None
+
+    # keep-out: crystal->microcontroller segment must not cross the zone.
+    # Line-sign formulation, broadcast over all surviving pairs: evaluate the
+    # segment line at the four zone corners and pair the sign products with
+    # the (axis-aligned) edge straddle tests.
+    p1x, p1y = xt_cx[ci], xt_cy[ci]
+    p2x, p2y = mc_cx[mi], mc_cy[mi]
+    zx0, zy0 = keepout_zone['x'], keepout_zone['y']
+    zx1, zy1 = zx0 + keepout_zone['w'], zy0 + keepout_zone['h']
+    a1 = p2y - p1y
+    b1 = p1x - p2x
+    c1 = p2x * p1y - p1x * p2y
+    f_tl = a1 * zx0 + b1 * zy0 + c1
+    f_tr = a1 * zx1 + b1 * zy0 + c1
+    f_br = a1 * zx1 + b1 * zy1 + c1
+    f_bl = a1 * zx0 + b1 * zy1 + c1
+    hits = (((f_tl * f_tr <= 0) & ((p1y - zy0) * (p2y - zy0) <= 0)) |
+            ((f_tr * f_br <= 0) & ((p1x - zx1) * (p2x - zx1) <= 0)) |
+            ((f_br * f_bl <= 0) & ((p1y - zy1) * (p2y - zy1) <= 0)) |
+            ((f_bl * f_tl <= 0) & ((p1x - zx0) * (p2x - zx0) <= 0)))
+    # an endpoint inside the zone is a hit even without an edge crossing,
+    # matching the Liang-Barsky semantics used by validate_full
+    hits |= ((p1x >= zx0) & (p1x <= zx1) & (p1y >= zy0) & (p1y <= zy1))
+    hits |= ((p2x >= zx0) & (p2x <= zx1) & (p2y >= zy0) & (p2y <= zy1))
+    mi, ci = mi[~hits], ci[~hits]
+    if mi.size == 0:
+        return None
+
+    # score every surviving pair and take the global argmin
+    ex0, ey0 = bx0.min(), by0.min()
+    ex1, ey1 = bx1.max(), by1.max()
+    min_x = np.minimum(ex0, np.minimum(Mx[mi], Cx[ci]))
+    min_y = np.minimum(ey0, np.minimum(My[mi], Cy[ci]))
+    max_x = np.maximum(ex1, np.maximum(Mx[mi] + mc_w, Cx[ci] + xt_w))
+    max_y = np.maximum(ey1, np.maximum(My[mi] + mc_h, Cy[ci] + xt_h))
+    bbox_area = (max_x - min_x) * (max_y - min_y)
+    centrality = np.sqrt((mc_cx[mi] - bc_x) ** 2 + (mc_cy[mi] - bc_y) ** 2)
+    total = bbox_area + 10.0 * centrality
+
+    k = int(np.argmin(total))
+    return (float(Mx[mi[k]]), float(My[mi[k]]), float(Cx[ci[k]]), float(Cy[ci[k]]),
+            float(total[k]), float(bbox_area[k]), float(centrality[k]))
+
+def _search(order, disk, base_aabbs, zx0, zy0, zx1, zy1,
+            board_w, board_h, mc_w, mc_h, xt_w, xt_h,
+            sx_lo, sx_hi, sy_lo, sy_hi,
+            com_r2, s_edge_x, s_edge_y, inv_n):
+    """
+    Scalar search kernel over all microcontroller/crystal pairs.
+
+    Straight-line float arithmetic over flat arrays — no dicts, tuples or
+    NumPy temporaries — written so Numba can compile the whole double loop
+    to native code. `order` is the center-first MC_ORDER table, so equal
+    scores resolve to the most central microcontroller position, matching
+    the vectorized path. Returns (score, mx, my, cx, cy, area, centrality)
+    with score >= 1e17 meaning "no valid pair".
+    """
+    nb = base_aabbs.shape[0]
+    # bounding-box extents of the fixed edge components
+    ex0 = base_aabbs[0, 0]
+    ey0 = base_aabbs[0, 1]
+    ex1 = base_aabbs[0, 0] + base_aabbs[0, 2]
+    ey1 = base_aabbs[0, 1] + base_aabbs[0, 3]
+    for i in range(1, nb):
+        x0 = base_aabbs[i, 0]
+        y0 = base_aabbs[i, 1]
+        x1 = x0 + base_aabbs[i, 2]
+        y1 = y0 + base_aabbs[i, 3]
+        if x0 < ex0:
+            ex0 = x0
+        if y0 < ey0:
+            ey0 = y0
+        if x1 > ex1:
+            ex1 = x1
+        if y1 > ey1:
+            ey1 = y1
+
+    bc_x = board_w * 0.5
+    bc_y = board_h * 0.5
+    best_score = 1.0e18
+    bmx = bmy = bcx = bcy = -1.0
+    barea = bcent = 0.0
+
+    for t in range(order.shape[0]):
+        mx = float(order[t, 0])
+        my = float(order[t, 1])
+        blocked = False
+        for i in range(nb):
+            if (mx + mc_w > base_aabbs[i, 0] and mx < base_aabbs[i, 0] + base_aabbs[i, 2] and
+                    my + mc_h > base_aabbs[i, 1] and my < base_aabbs[i, 1] + base_aabbs[i, 3]):
+                blocked = True
+                break
+        if blocked:
+            continue
+
+        mc_cx = mx + mc_w * 0.5
+        mc_cy = my + mc_h * 0.5
+        cent = math.sqrt((mc_cx - bc_x) ** 2 + (mc_cy - bc_y) ** 2)
+
+        # Lower-bound prune: the bounding box can only grow once the crystal
+        # is added, so if the edge+microcontroller envelope alone already
+        # scores no better than the incumbent, no crystal position can win
+        # and the whole inner loop is skipped. With the center-first order
+        # this rejects most candidates as soon as a good placement is found.
+        lb_min_x = min(ex0, mx)
+        lb_min_y = min(ey0, my)
+        lb_max_x = max(ex1, mx + mc_w)
+        lb_max_y = max(ey1, my + mc_h)
+        lb_area = (lb_max_x - lb_min_x) * (lb_max_y - lb_min_y)
+        if lb_area + 10.0 * cent >= best_score:
+            continue
+
+        # enumerate only proximity-feasible crystal cells: the disk offsets
+        # make the distance check implicit
+        for d in range(disk.shape[0]):
+            cxi = order[t, 0] + disk[d, 0]
+            cyi = order[t, 1] + disk[d, 1]
+            if (cxi < 0 or cyi < 0 or
+                    cxi > board_w - xt_w or cyi > board_h - xt_h):
+                continue
+            cx = float(cxi)
+            cy = float(cyi)
+            xt_cx = cx + xt_w * 0.5
+            xt_cy = cy + xt_h * 0.5
+            # a crystal inside the safe interior window cannot touch any
+            # edge component; only border candidates run the overlap loop
+            if not (sx_lo <= cx <= sx_hi and sy_lo <= cy <= sy_hi):
+                blocked = False
+                for i in range(nb):
+                    if (cx + xt_w > base_aabbs[i, 0] and cx < base_aabbs[i, 0] + base_aabbs[i, 2] and
+                            cy + xt_h > base_aabbs[i, 1] and cy < base_aabbs[i, 1] + base_aabbs[i, 3]):
+                        blocked = True
+                        break
+                if blocked:
+                    continue
+            if (cx + xt_w > mx and cx < mx + mc_w and
+                    cy + xt_h > my and cy < my + mc_h):
+                continue
+            com_x = (s_edge_x + mc_cx + xt_cx) * inv_n
+            com_y = (s_edge_y + mc_cy + xt_cy) * inv_n
+            ddx = com_x - bc_x
+            ddy = com_y - bc_y
+            if ddx * ddx + ddy * ddy > com_r2:
+                continue
+            if line_hits_aabb(xt_cx, xt_cy, mc_cx, mc_cy, zx0, zy0, zx1, zy1):
+                continue
+
+            min_x = min(lb_min_x, cx)
+            min_y = min(lb_min_y, cy)
+            max_x = max(lb_max_x, cx + xt_w)
+            max_y = max(lb_max_y, cy + xt_h)
+            area = (max_x - min_x) * (max_y - min_y)
+            total = area + 10.0 * cent
+            if total < best_score:
+                best_score = total
+                bmx = mx
+                bmy = my
+                bcx = cx
+                bcy = cy
+                barea = area
+                bcent = cent
+
+    return best_score, bmx, bmy, bcx, bcy, barea, bcent
+
+def _search_parallel(order, disk, base_aabbs, zx0, zy0, zx1, zy1,
+                     board_w, board_h, mc_w, mc_h, xt_w, xt_h,
+                     sx_lo, sx_hi, sy_lo, sy_hi,
+                     com_r2, s_edge_x, s_edge_y, inv_n):
+    """
+    Parallel wrapper around _search: the center-first candidate table is cut
+    into one contiguous slice per thread, each slice runs the sequential
+    kernel (keeping its thread-local incumbent for pruning), and the
+    per-thread bests are reduced with a final argmin.
+    """
+    nt = get_num_threads()
+    n = order.shape[0]
+    chunk = (n + nt - 1) // nt
+    results = np.empty((nt, 7), dtype=np.float64)
+    for c in prange(nt):
+        lo = c * chunk
+        hi = min(n, lo + chunk)
+        score, mx, my, cx, cy, area, cent = _search(
+            order[lo:hi], disk, base_aabbs, zx0, zy0, zx1, zy1,
+            board_w, board_h, mc_w, mc_h, xt_w, xt_h,
+            sx_lo, sx_hi, sy_lo, sy_hi,
+            com_r2, s_edge_x, s_edge_y, inv_n)
+        results[c, 0] = score
+        results[c, 1] = mx
+        results[c, 2] = my
+        results[c, 3] = cx
+        results[c, 4] = cy
+        results[c, 5] = area
+        results[c, 6] = cent
+    k = np.argmin(results[:, 0])
+    return (results[k, 0], results[k, 1], results[k, 2], results[k, 3],
+            results[k, 4], results[k, 5], results[k, 6])
+
+if HAVE_NUMBA:
+    # cache=True persists the compiled kernels, so JIT compilation is a
+    # one-time cost per machine rather than per run.
+    line_hits_aabb = njit(cache=True, fastmath=True)(line_hits_aabb)
+    _search = njit(cache=True, fastmath=True)(_search)
+    # parallel kernels cannot be disk-cached, so this one compiles per process
+    _search_parallel = njit(parallel=True, fastmath=True)(_search_parallel)
+
+def search_best_pair_jit(comps, keepout_zone, parallel=False):
+    """
+    Unpack the edge rows into flat scalars and run the Numba kernel.
+
+    parallel=True fans the outer sweep across threads via _search_parallel;
+    on this assignment's 46x46 grid the sequential kernel with its shared
+    incumbent finishes in well under a millisecond, so threading only pays
+    off for substantially larger boards and stays opt-in.
+    """
+    mc_w, mc_h = SIZES['MICROCONTROLLER']
+    xt_w, xt_h = SIZES['CRYSTAL']
+    base_aabbs = np.ascontiguousarray(comps[EDGE_ROWS])
+    s_edge_x, s_edge_y = edge_center_sums(base_aabbs)
+    sx_lo, sx_hi, sy_lo, sy_hi = compute_safe_region(base_aabbs, xt_w, xt_h)
+    kernel = _search_parallel if parallel else _search
+    score, mx, my, cx, cy, area, cent = kernel(
+        MC_ORDER, DISK_OFFSETS, base_aabbs,
+        float(keepout_zone['x']), float(keepout_zone['y']),
+        float(keepout_zone['x'] + keepout_zone['w']),
+        float(keepout_zone['y'] + keepout_zone['h']),
+        float(BOARD_DIMS[0]), float(BOARD_DIMS[1]),
+        float(mc_w), float(mc_h), float(xt_w), float(xt_h),
+        sx_lo, sx_hi, sy_lo, sy_hi,
+        COM_R2, s_edge_x, s_edge_y, 1.0 / 5.0)
+    if score >= 1.0e17:
+        return None
+    return mx, my, cx, cy, score, area, cent
+
+def find_solution(timeout=1.8):
+    """
+    Find the best valid placement on the unit grid.
+
+    The search evaluates every candidate pair in one pass — through the
+    Numba-compiled scalar kernel when numba is installed, otherwise the
+    vectorized NumPy path (see search_best_pair) — rather than racing a
+    per-candidate timeout; the timeout parameter is kept for interface
+    compatibility.
+    Returns (comps, total_score, bbox_area, centrality) — comps being the
+    fully filled (5, 4) component array — or four Nones.
+    """
+    comps = place_edge_components()
+    keepout_zone = compute_keepout_zone(comps[USB], edge=USB_EDGE)
+
+    if HAVE_NUMBA:
+        found = search_best_pair_jit(comps, keepout_zone)
+    else:
+        found = search_best_pair(comps, keepout_zone)
+    if found is None:
+        return None, None, None, None
+    mx, my, cx, cy, total_score, bbox_area, centrality = found
+
+    comps[MC] = (mx, my, SIZES['MICROCONTROLLER'][0], SIZES['MICROCONTROLLER'][1])
+    comps[XT] = (cx, cy, SIZES['CRYSTAL'][0], SIZES['CRYSTAL'][1])
+    return comps, total_score, bbox_area, centrality
+
+def plot_and_save(comps, out_png="placement_snapshot_algo.png"):
+    # Build the figure directly on an Agg canvas: no pyplot global state
+    # machine, no figure-manager registration, no close() bookkeeping, and
+    # still no GUI event loop at all.
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    import matplotlib.patches as patches
+
+    fig = Figure(figsize=(8, 8), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.set_xlim(0, BOARD_DIMS[0])
+    ax.set_ylim(0, BOARD_DIMS[1])
+    ax.set_xticks(range(0, BOARD_DIMS[0]+1, 5))
+    ax.set_yticks(range(0, BOARD_DIMS[1]+1, 5))
+    ax.grid(True, linestyle='--', color='gray', alpha=0.3)
+    ax.set_aspect('equal', adjustable='box')
+    ax.invert_yaxis()
+    ax.set_title("PCB Component Placement Solution (Algorithmic)")
+
+    color_map = {
+        'USB_CONNECTOR': '#e74c3c',
+        'MICROCONTROLLER': '#3498db',
+        'CRYSTAL': '#f39c12',
+        'MIKROBUS_CONNECTOR_1': '#9b59b6',
+        'MIKROBUS_CONNECTOR_2': '#8e44ad'
+    }
+    labels = {
+        'USB_CONNECTOR': 'USB',
+        'MICROCONTROLLER': 'μC',
+        'CRYSTAL': 'XTAL',
+        'MIKROBUS_CONNECTOR_1': 'MB1',
+        'MIKROBUS_CONNECTOR_2': 'MB2'
+    }
+
+    for i, name in enumerate(COMP_NAMES):
+        comp = comps[i]
+        rect = patches.Rectangle((comp[0], comp[1]), comp[2], comp[3],
+                                 linewidth=1.5, edgecolor='black', facecolor=color_map[name])
+        ax.add_patch(rect)
+        ax.text(comp[0] + comp[2]/2.0, comp[1] + comp[3]/2.0, labels[name],
+                color='white', ha='center', va='center', fontweight='bold')
+
+    # proximity circle around microcontroller
+    uc_center = center_of(comps[MC])
+    circle = patches.Circle(uc_center, PROXIMITY_RADIUS, fill=True, color='#f39c12', alpha=0.1, linestyle='--')
+    ax.add_patch(circle)
+
+    # keepout zone from USB
+    zone = compute_keepout_zone(comps[USB])
+    keepout = patches.Rectangle((zone['x'], zone['y']), zone['w'], zone['h'], fill=True, color='#e74c3c', alpha=0.15, linestyle='--')
+    ax.add_patch(keepout)
+
+    # draw line between crystal and microcontroller
+    xt_center = center_of(comps[XT])
+    ax.plot([xt_center[0], uc_center[0]], [xt_center[1], uc_center[1]], 'k--', linewidth=2)
+
+    canvas.print_png(out_png)
+    return out_png
+
+def main():
+    t0 = time.perf_counter()
+
+    comps, score_val, bbox_area, centrality = find_solution(timeout=1.8)
+    if comps is None:
+        print("No valid placement found within time limit.")
+        return
+
+    # finalize and validate with the included validator logic
+    valid, results = validate_full(comps)
+    t1 = time.perf_counter()
+    elapsed = t1 - t0
+
+    # print validator-style summary
+    print("--- DEMO: Algorithmic Placement ---")
+    print("--- Running Detailed Hard Constraint Validation ---")
+    for rule, (ok, msg) in results.items():
+        status = "✅ PASSED" if ok else "❌ FAILED"
+        print(f"{rule:<22}: {status} {msg}")
+
+    print("\n--- Performance Report for Validation and Placement ---")
+    print(f"Placement search + validation finished in: {elapsed:.6f} seconds")
+    if elapsed <= VALIDATION_TIME_LIMIT:
+        print("✅ PERFORMANCE PASSED (under 2s)")
+    else:
+        print("❌ PERFORMANCE FAILED (too slow)")
+
+    # compute final score
+    total_score, bbox_area, centrality = compute_score(comps)
+    print("\n--- Calculated Score ---")
+    print(f"Compactness (Bounding Box Area): {bbox_area:.2f}")
+    print(f"Centrality (uC distance to center): {centrality:.2f}")
+    print(f"Total Combined Score: {total_score:.2f}")
+
+    # save outputs (dict-of-dicts shape only at the JSON boundary);
+    # orjson serializes ~5-10x faster when available
+    out_json = "my_algorithmic_placement.json"
+    placement_dict = placement_to_dict(comps)
+    if orjson is not None:
+        with open(out_json, "wb") as fh:
+            fh.write(orjson.dumps(placement_dict, option=orjson.OPT_INDENT_2))
+    else:
+        with open(out_json, "w") as fh:
+            json.dump(placement_dict, fh, indent=2)
+    out_png = plot_and_save(comps, out_png="placement_snapshot_algo.png")
+    out_txt = "self_score_algo.txt"
+    with open(out_txt, "w") as fh:
+        fh.write("Validation Results:\n")
+        for rule, (ok, msg) in results.items():
+            fh.write(f"{rule}: {'PASS' if ok else 'FAIL'} {msg}\n")
+        fh.write(f"\nPlacement search+validation time: {elapsed:.6f} s\n")
+        fh.write(f"Total Score: {total_score:.2f}\n")
+        fh.write(f"Compactness (area): {bbox_area:.2f}\n")
+        fh.write(f"Centrality: {centrality:.2f}\n")
+
+    print(f"\nSaved placement JSON: {out_json}")
+    print(f"Saved snapshot PNG: {out_png}")
+    print(f"Saved self-score TXT: {out_txt}")
+
+if __name__ == "__main__":
+    main()